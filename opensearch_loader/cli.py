@@ -3,61 +3,66 @@
 import argparse
 import logging
 import sys
-from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
-from .config import Config
-from .loader import Loader
+if TYPE_CHECKING:
+    from .config import Config
 
+# Third-party loggers that are too chatty at INFO level
+NOISY_LOGGERS = ('opensearch', 'opensearchpy', 'elasticsearch', 'urllib3')
 
-def setup_logging(verbose: bool = False):
-    """Setup logging configuration."""
+# Argument parser, built on first use so importing this module stays cheap
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def setup_logging(verbose: bool = False, force: bool = False):
+    """Setup logging configuration.
+    
+    Args:
+        verbose: Log at DEBUG instead of INFO
+        force: Replace existing root handlers, so repeated in-process runs of the
+            standalone CLI get the requested level. Leave False when embedded (e.g.
+            under Prefect), where the host's logging configuration is kept.
+    """
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         level=level,
         format='%(asctime)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        datefmt='%Y-%m-%d %H:%M:%S',
+        force=force
     )
     
     # Set opensearch library loggers to WARNING to suppress INFO level HTTP request logs
-    logging.getLogger('opensearch').setLevel(logging.WARNING)
-    logging.getLogger('opensearchpy').setLevel(logging.WARNING)
-    logging.getLogger('elasticsearch').setLevel(logging.WARNING)
-    logging.getLogger('urllib3').setLevel(logging.WARNING)
+    for name in NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
 
 
-def print_config(config: Config):
+def print_config(config: 'Config'):
     """Print configuration variables excluding connection information.
     
     Args:
         config: Configuration object
     """
     logger = logging.getLogger(__name__)
-    logger.info("Configuration:")
-    
-    # Fields to exclude from memgraph and opensearch
-    excluded_memgraph = {'host', 'port', 'username', 'password'}
-    excluded_opensearch = {'host', 'use_ssl', 'verify_certs', 'username', 'password'}
-    
-    # Print non-connection config values
-    if config.get('index_spec_file'):
-        logger.info(f"  index_spec_file: {config.get('index_spec_file')}")
-    
-    if config.get('clear_existing_indices') is not None:
-        logger.info(f"  clear_existing_indices: {config.get('clear_existing_indices')}")
     
-    if config.get('allow_index_creation') is not None:
-        logger.info(f"  allow_index_creation: {config.get('allow_index_creation')}")
-    
-    selected_indices = config.get_selected_indices()
-    if selected_indices:
-        logger.info(f"  selected_indices: {selected_indices}")
+    # Non-connection config values as (key, value, show_when_false)
+    rows = (
+        ('index_spec_file', config.get('index_spec_file'), False),
+        ('clear_existing_indices', config.get('clear_existing_indices'), True),
+        ('allow_index_creation', config.get('allow_index_creation'), True),
+        ('selected_indices', config.get_selected_indices(), False),
+        ('test_mode', config.get_test_mode(), False),
+        ('max_index_workers', config.get_max_index_workers(), False),
+    )
+    lines = [f"  {key}: {value}" for key, value, show_when_false in rows
+             if value or (show_when_false and value is not None)]
     
-    if config.get_test_mode():
-        logger.info(f"  test_mode: {config.get_test_mode()}")
+    # Emit a single log record for the whole block
+    logger.info("Configuration:\n%s", "\n".join(lines))
 
 
-def parse_args():
-    """Parse command-line arguments."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description='Load data from Memgraph to OpenSearch',
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -101,6 +106,7 @@ def parse_args():
     parser.add_argument(
         '--opensearch-use-ssl',
         action='store_true',
+        default=None,
         help='Use SSL for OpenSearch (overrides config and env)'
     )
     parser.add_argument(
@@ -112,6 +118,7 @@ def parse_args():
     parser.add_argument(
         '--opensearch-verify-certs',
         action='store_true',
+        default=None,
         help='Verify SSL certificates (overrides config and env)'
     )
     parser.add_argument(
@@ -139,28 +146,16 @@ def parse_args():
     )
     parser.add_argument(
         '--clear-existing-indices',
-        action='store_true',
-        default=argparse.SUPPRESS,
+        action=argparse.BooleanOptionalAction,
+        default=None,
         help='Clear existing indices before starting (overrides config and env)'
     )
-    parser.add_argument(
-        '--no-clear-existing-indices',
-        dest='clear_existing_indices',
-        action='store_false',
-        help='Do not clear existing indices before starting (overrides config and env)'
-    )
     parser.add_argument(
         '--allow-index-creation',
-        action='store_true',
-        default=argparse.SUPPRESS,
+        action=argparse.BooleanOptionalAction,
+        default=None,
         help='Allow creation of indices if they do not exist (overrides config and env)'
     )
-    parser.add_argument(
-        '--no-allow-index-creation',
-        dest='allow_index_creation',
-        action='store_false',
-        help='Do not allow creation of indices if they do not exist (overrides config and env)'
-    )
     parser.add_argument(
         '--selected-indices',
         type=str,
@@ -182,11 +177,18 @@ def parse_args():
     # Test mode
     parser.add_argument(
         '--test-mode',
-        action='store_true',
-        default=argparse.SUPPRESS,
+        action=argparse.BooleanOptionalAction,
+        default=None,
         help='Run in test mode: only process one page per query to validate queries (overrides config and env)'
     )
     
+    # Concurrency
+    parser.add_argument(
+        '--max-index-workers',
+        type=int,
+        help='Number of indices to process concurrently (default: 2, overrides config and env)'
+    )
+    
     # Other options
     parser.add_argument(
         '-v', '--verbose',
@@ -194,24 +196,44 @@ def parse_args():
         help='Enable verbose logging'
     )
     
-    return parser.parse_args()
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse command-line arguments.
+    
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+    """
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    args = _PARSER.parse_args(argv)
+    
+    # Trim string values once here so Config can use them as-is
+    for key, value in vars(args).items():
+        if isinstance(value, str):
+            setattr(args, key, value.strip())
+    
+    return args
 
 
 def main():
     """Main entry point."""
     args = parse_args()
-    setup_logging(verbose=args.verbose)
+    setup_logging(verbose=args.verbose, force=True)
     
     logger = logging.getLogger(__name__)
     
+    # Deferred imports: keep --help and argparse errors from pulling in the
+    # OpenSearch/Memgraph client libraries
+    from .config import Config
+    from .loader import Loader
+    
     try:
         # Load configuration
-        config_file = args.config
-        if not config_file:
-            # Try default config file
-            default_config = Path('config.yaml')
-            if default_config.exists():
-                config_file = str(default_config)
+        # Fall back to the default config file; Config skips it if it does not exist
+        config_file = args.config or 'config.yaml'
         
         config = Config(config_file=config_file, cli_args=args)
         
@@ -219,12 +241,9 @@ def main():
         print_config(config)
         
         # Create and run loader
-        loader = Loader(config)
-        try:
+        with Loader(config) as loader:
             loader.load()
             logger.info("Data loading completed successfully")
-        finally:
-            loader.close()
         
         return 0
     
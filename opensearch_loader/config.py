@@ -1,14 +1,276 @@
 """Configuration management with precedence: CLI > env > YAML."""
 
 import os
+import json
 import yaml
+import pickle
+import hashlib
+import tempfile
 import argparse
+import functools
 import logging
-from typing import Dict, Any, Optional, List
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, Optional, Mapping, Tuple, FrozenSet
 from pathlib import Path
 
 logger = logging.getLogger("OpenSearchLoader")
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one if libyaml is unavailable
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+logger.debug(f"Using YAML loader: {_YamlLoader.__name__}")
+
+# Loader for iter_yaml_sequence: libyaml parses events, the Python composer builds one item at a time
+try:
+    from yaml import CParser
+    
+    class _SequenceLoader(CParser, yaml.composer.Composer, yaml.constructor.SafeConstructor,
+                          yaml.resolver.Resolver):
+        def __init__(self, stream):
+            CParser.__init__(self, stream)
+            yaml.composer.Composer.__init__(self)
+            yaml.constructor.SafeConstructor.__init__(self)
+            yaml.resolver.Resolver.__init__(self)
+except ImportError:
+    _SequenceLoader = yaml.SafeLoader
+
+# Parsed config files are cached here, keyed by path and validated by (mtime_ns, size)
+CONFIG_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'opensearch-loader'
+
+# Version of the cached entry format; bump it when what is cached changes so older entries are ignored
+CONFIG_CACHE_VERSION = 1
+
+
+def load_yaml_file(path: str) -> Any:
+    """Parse a YAML file with the libyaml loader, or the C JSON parser when the content is plain JSON.
+    
+    JSON documents (.json files, or content starting with "{") are parsed with
+    json.loads, falling back to YAML if that fails. Note that json.loads keeps the
+    last of duplicate keys and accepts NaN/Infinity, where YAML parsing may differ.
+    """
+    # Read raw bytes: both parsers decode UTF-8 themselves, so skip the text-mode decode pass
+    with open(path, 'rb') as f:
+        buf = f.read()
+    if path.endswith('.json') or buf.lstrip().startswith(b'{'):
+        try:
+            return json.loads(buf)
+        except ValueError:
+            pass
+    return yaml.load(buf, Loader=_YamlLoader)
+
+
+def iter_yaml_sequence(path: str) -> Iterator[Any]:
+    """Parse a YAML file whose top level is a list, yielding one item at a time.
+    
+    Each item is built and yielded as soon as it has been parsed, so the whole
+    list is never held in memory. An empty file yields nothing.
+    
+    Raises:
+        ValueError: If the top-level value is not a list
+    """
+    with open(path, 'rb') as f:
+        loader = _SequenceLoader(f)
+        try:
+            loader.get_event()  # StreamStartEvent
+            if loader.check_event(yaml.StreamEndEvent):
+                return
+            loader.get_event()  # DocumentStartEvent
+            if loader.check_event(yaml.ScalarEvent):
+                event = loader.peek_event()
+                if event.value == '' and event.implicit[0]:
+                    return  # Document without content (a quoted '' is a string, rejected below)
+            if not loader.check_event(yaml.SequenceStartEvent):
+                raise ValueError(f"{path}: top-level value must be a list")
+            loader.get_event()
+            while not loader.check_event(yaml.SequenceEndEvent):
+                yield loader.construct_document(loader.compose_node(None, None))
+        finally:
+            loader.dispose()
+
+
+def _config_cache_path(config_file: str) -> Path:
+    """Get the cache file path for a configuration file (and cache format version)."""
+    key = hashlib.blake2b(f"{CONFIG_CACHE_VERSION}:{Path(config_file).resolve()}".encode()).hexdigest()[:16]
+    return CONFIG_CACHE_DIR / f"{key}.pkl"
+
+
+def _read_config_cache(config_file: str, st: os.stat_result) -> Optional[Dict[str, Any]]:
+    """Return the cached parsed config if it is still fresh, None otherwise.
+    
+    Any entry that cannot be read or unpickled, or was written by another cache
+    format version, is treated as a miss.
+    """
+    try:
+        with open(_config_cache_path(config_file), 'rb') as f:
+            version, mtime_ns, size, config = pickle.load(f)
+    except Exception:
+        return None
+    if version != CONFIG_CACHE_VERSION or mtime_ns != st.st_mtime_ns or size != st.st_size:
+        return None
+    return config
+
+
+def _write_config_cache(config_file: str, st: os.stat_result, config: Dict[str, Any]):
+    """Atomically write a parsed config to the cache. Failures are not fatal."""
+    try:
+        CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CONFIG_CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((CONFIG_CACHE_VERSION, st.st_mtime_ns, st.st_size, config), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, _config_cache_path(config_file))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        logger.debug(f"Could not write config cache for {config_file}: {e}")
+
+
+# Default thresholds for merging small pages into one bulk upsert
+DEFAULT_TARGET_BULK_DOCS = 5000
+DEFAULT_TARGET_BULK_BYTES = 50 * 1024 * 1024
+
+# Default number of indices processed concurrently
+DEFAULT_MAX_INDEX_WORKERS = 2
+
+# Default number of concurrent bulk requests per query
+DEFAULT_BULK_WORKERS = 4
+
+# Default number of Memgraph pages read ahead of the OpenSearch writer
+DEFAULT_PREFETCH_PAGES = 2
+
+# Default number of attempts for a bulk request failing with a transient error
+DEFAULT_BULK_RETRY_ATTEMPTS = 3
+
+# Default bulk request duration (seconds) the adaptive bulk size aims to stay under
+DEFAULT_BULK_LATENCY_TARGET = 2.0
+
+# Accepted boolean spellings for environment variable values
+TRUE_VALUES = frozenset(('true', '1', 'yes'))
+FALSE_VALUES = frozenset(('false', '0', 'no'))
+
+# Environment variable suffix (after Config.ENV_PREFIX) -> config path, built once per process
+ENV_MAPPING = {
+    'MEMGRAPH_HOST': ('memgraph', 'host'),
+    'MEMGRAPH_PORT': ('memgraph', 'port'),
+    'MEMGRAPH_USERNAME': ('memgraph', 'username'),
+    'MEMGRAPH_PASSWORD': ('memgraph', 'password'),
+    'OPENSEARCH_HOST': ('opensearch', 'host'),
+    'OPENSEARCH_USE_SSL': ('opensearch', 'use_ssl'),
+    'OPENSEARCH_VERIFY_CERTS': ('opensearch', 'verify_certs'),
+    'OPENSEARCH_USERNAME': ('opensearch', 'username'),
+    'OPENSEARCH_PASSWORD': ('opensearch', 'password'),
+    'INDEX_SPEC_FILE': ('index_spec_file',),
+    'CLEAR_EXISTING_INDICES': ('clear_existing_indices',),
+    'ALLOW_INDEX_CREATION': ('allow_index_creation',),
+    'SELECTED_INDICES': ('selected_indices',),
+    'ABOUT_FILE': ('about_file',),
+    'MODEL_FILES': ('model_files',),
+    'TEST_MODE': ('test_mode',),
+    'MAX_INDEX_WORKERS': ('max_index_workers',),
+    'BULK_WORKERS': ('bulk_workers',),
+    'TARGET_BULK_DOCS': ('target_bulk_docs',),
+    'TARGET_BULK_BYTES': ('target_bulk_bytes',),
+    'STREAM_QUERIES': ('stream_queries',),
+    'TUNE_FOR_BULK': ('tune_for_bulk',),
+    'PREFETCH_PAGES': ('prefetch_pages',),
+    'ADAPTIVE_BULK_SIZE': ('adaptive_bulk_size',),
+    'BULK_LATENCY_TARGET': ('bulk_latency_target',),
+    'BULK_RETRY_ATTEMPTS': ('bulk_retry_attempts',),
+    'ALIAS_SWAP': ('alias_swap',),
+    'STRICT_MAPPING': ('strict_mapping',),
+}
+
+# CLI argument -> config path. Kinds: 'value' (set when non-empty), 'bool' (set whenever provided)
+# and 'list' (comma-separated, set when non-empty). String arguments arrive already trimmed.
+CLI_MAPPING = (
+    ('memgraph_host', ('memgraph', 'host'), 'value'),
+    ('memgraph_port', ('memgraph', 'port'), 'value'),
+    ('memgraph_username', ('memgraph', 'username'), 'value'),
+    ('memgraph_password', ('memgraph', 'password'), 'value'),
+    ('opensearch_host', ('opensearch', 'host'), 'value'),
+    ('opensearch_use_ssl', ('opensearch', 'use_ssl'), 'bool'),
+    ('opensearch_verify_certs', ('opensearch', 'verify_certs'), 'bool'),
+    ('opensearch_username', ('opensearch', 'username'), 'value'),
+    ('opensearch_password', ('opensearch', 'password'), 'value'),
+    ('index_spec_file', ('index_spec_file',), 'value'),
+    ('clear_existing_indices', ('clear_existing_indices',), 'bool'),
+    ('allow_index_creation', ('allow_index_creation',), 'bool'),
+    ('selected_indices', ('selected_indices',), 'list'),
+    ('about_file', ('about_file',), 'value'),
+    ('model_files', ('model_files',), 'list'),
+    ('test_mode', ('test_mode',), 'bool'),
+    ('max_index_workers', ('max_index_workers',), 'value'),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedConfig:
+    """Immutable snapshot of the merged configuration, built once after loading."""
+    
+    memgraph: Mapping[str, Any]
+    opensearch: Mapping[str, Any]
+    index_spec_file: Optional[str]
+    clear_existing_indices: bool
+    allow_index_creation: bool
+    selected_indices: Optional[Tuple[str, ...]]
+    about_file: Optional[str]
+    model_files: Optional[Tuple[str, ...]]
+    test_mode: bool
+    max_index_workers: int
+    bulk_workers: int
+    target_bulk_docs: int
+    target_bulk_bytes: int
+    stream_queries: bool
+    tune_for_bulk: bool
+    prefetch_pages: int
+    adaptive_bulk_size: bool
+    bulk_latency_target: float
+    bulk_retry_attempts: int
+    alias_swap: bool
+    strict_mapping: bool
+
+
+def _normalize_name_list(value: Any) -> Optional[Tuple[str, ...]]:
+    """Normalize a list (or single string) of names to a tuple of trimmed, non-empty strings.
+    
+    Duplicate names are dropped, keeping the first occurrence. Returns None if the
+    value is not set or contains no names.
+    """
+    if isinstance(value, list):
+        # Single pass: trim each name, drop any that end up empty, de-duplicate in order
+        return tuple(dict.fromkeys(filter(None, (str(v).strip() for v in value if v)))) or None
+    elif isinstance(value, str):
+        # Handle string case (shouldn't happen with proper config, but defensive)
+        trimmed = value.strip()
+        return (trimmed,) if trimmed else None
+    return None
+
+
+def _count_setting(value: Any, default: int) -> int:
+    """Resolve a count setting: default when unset, otherwise at least 1 (so 0 means 1, not the default)."""
+    if value is None or value == '':
+        return default
+    return max(1, int(value))
+
+
+def _normalize_path_list(value: Any) -> Optional[Tuple[str, ...]]:
+    """Normalize a list (or single string) of file paths to a tuple of trimmed strings.
+    
+    Unlike _normalize_name_list, paths are kept as given (order and duplicates), and
+    an empty list stays an empty tuple. Returns None if the value is not set.
+    """
+    if isinstance(value, list):
+        return tuple(str(v).strip() for v in value if v)
+    elif isinstance(value, str):
+        trimmed = value.strip()
+        return (trimmed,) if trimmed else None
+    return None
+
 
 class Config:
     """Configuration manager with precedence: CLI > env > YAML."""
@@ -29,11 +291,12 @@ class Config:
         """
         self.config: Dict[str, Any] = {}
         
-        # Load from YAML file (lowest precedence)
-        if config_file and Path(config_file).exists():
-            with open(config_file, 'r') as f:
-                self.config = yaml.safe_load(f) or {}
-                self.config = self._trim_config_values(self.config)
+        # Load from YAML file (lowest precedence); a missing file is skipped
+        if config_file:
+            try:
+                self.config = self._load_from_yaml(config_file)
+            except FileNotFoundError:
+                logger.debug(f"Configuration file not found, skipping: {config_file}")
         
         # Override with environment variables
         self._load_from_env()
@@ -41,50 +304,83 @@ class Config:
         # Override with CLI arguments (highest precedence)
         if cli_args:
             self._load_from_cli(cli_args)
+        
+        # Freeze the merged configuration so getters are plain attribute reads
+        self._resolved = self._resolve()
+    
+    def _resolve(self) -> ResolvedConfig:
+        """Build the immutable configuration snapshot from the merged config dict."""
+        config = self.config
+        return ResolvedConfig(
+            memgraph=MappingProxyType(dict(config.get('memgraph') or {})),
+            opensearch=MappingProxyType(dict(config.get('opensearch') or {})),
+            index_spec_file=config.get('index_spec_file'),
+            clear_existing_indices=config.get('clear_existing_indices', False),
+            allow_index_creation=config.get('allow_index_creation', True),
+            selected_indices=_normalize_name_list(config.get('selected_indices')),
+            about_file=config.get('about_file'),
+            model_files=_normalize_path_list(config.get('model_files')),
+            test_mode=config.get('test_mode', False),
+            max_index_workers=_count_setting(config.get('max_index_workers'), DEFAULT_MAX_INDEX_WORKERS),
+            bulk_workers=_count_setting(config.get('bulk_workers'), DEFAULT_BULK_WORKERS),
+            target_bulk_docs=int(config.get('target_bulk_docs') or DEFAULT_TARGET_BULK_DOCS),
+            target_bulk_bytes=int(config.get('target_bulk_bytes') or DEFAULT_TARGET_BULK_BYTES),
+            stream_queries=config.get('stream_queries', False),
+            tune_for_bulk=config.get('tune_for_bulk', True),
+            prefetch_pages=_count_setting(config.get('prefetch_pages'), DEFAULT_PREFETCH_PAGES),
+            adaptive_bulk_size=config.get('adaptive_bulk_size', False),
+            bulk_latency_target=float(config.get('bulk_latency_target') or DEFAULT_BULK_LATENCY_TARGET),
+            bulk_retry_attempts=_count_setting(config.get('bulk_retry_attempts'), DEFAULT_BULK_RETRY_ATTEMPTS),
+            alias_swap=config.get('alias_swap', False),
+            strict_mapping=config.get('strict_mapping', False),
+        )
+    
+    def _load_from_yaml(self, config_file: str) -> Dict[str, Any]:
+        """Load and trim a YAML configuration file, reusing the on-disk cache when fresh."""
+        st = os.stat(config_file)
+        config = _read_config_cache(config_file, st)
+        if config is not None:
+            logger.debug(f"Using cached configuration for {config_file}")
+            return config
+        
+        config = load_yaml_file(config_file) or {}
+        self._trim_config_values(config)
+        _write_config_cache(config_file, st, config)
+        return config
     
     def _load_from_env(self):
         """Load configuration from environment variables."""
-        env_mapping = {
-            'OS_LOADER_MEMGRAPH_HOST': ('memgraph', 'host'),
-            'OS_LOADER_MEMGRAPH_PORT': ('memgraph', 'port'),
-            'OS_LOADER_MEMGRAPH_USERNAME': ('memgraph', 'username'),
-            'OS_LOADER_MEMGRAPH_PASSWORD': ('memgraph', 'password'),
-            'OS_LOADER_OPENSEARCH_HOST': ('opensearch', 'host'),
-            'OS_LOADER_OPENSEARCH_USE_SSL': ('opensearch', 'use_ssl'),
-            'OS_LOADER_OPENSEARCH_VERIFY_CERTS': ('opensearch', 'verify_certs'),
-            'OS_LOADER_OPENSEARCH_USERNAME': ('opensearch', 'username'),
-            'OS_LOADER_OPENSEARCH_PASSWORD': ('opensearch', 'password'),
-            'OS_LOADER_INDEX_SPEC_FILE': ('index_spec_file',),
-            'OS_LOADER_CLEAR_EXISTING_INDICES': ('clear_existing_indices',),
-            'OS_LOADER_ALLOW_INDEX_CREATION': ('allow_index_creation',),
-            'OS_LOADER_SELECTED_INDICES': ('selected_indices',),
-            'OS_LOADER_ABOUT_FILE': ('about_file',),
-            'OS_LOADER_MODEL_FILES': ('model_files',),
-            'OS_LOADER_TEST_MODE': ('test_mode',),
-        }
+        # In the common case no loader variables are set; skip the mapping walk entirely
+        env = os.environ
+        if not any(k.startswith(self.ENV_PREFIX) for k in env):
+            return
         
-        for env_var, path in env_mapping.items():
-            value = os.getenv(env_var)
-            if value is not None:
-                # Trim whitespace before parsing
-                value = value.strip()
-                parsed_value = self._parse_env_value(value)
-                if len(path) == 1:
-                    self._set_nested(self.config, path[0], parsed_value)
-                else:
-                    if path[0] not in self.config:
-                        self.config[path[0]] = {}
-                    self._set_nested(self.config[path[0]], path[1], parsed_value)
+        prefix = self.ENV_PREFIX
+        for suffix, path in ENV_MAPPING.items():
+            value = env.get(prefix + suffix)
+            if value is None:
+                continue
+            # Trim whitespace before parsing
+            value = value.strip()
+            parsed_value = self._parse_env_value(value)
+            if len(path) == 1:
+                self._set_nested(self.config, path[0], parsed_value)
+            else:
+                if path[0] not in self.config:
+                    self.config[path[0]] = {}
+                self._set_nested(self.config[path[0]], path[1], parsed_value)
     
     def _parse_env_value(self, value: str) -> Any:
-        """Parse environment variable value to appropriate type."""
-        # Value should already be trimmed, but trim again for safety
-        value = value.strip()
+        """Parse environment variable value to appropriate type.
         
+        Args:
+            value: Raw value, already trimmed by the caller
+        """
         # Try boolean
-        if value.lower() in ('true', '1', 'yes'):
+        lowered = value.lower()
+        if lowered in TRUE_VALUES:
             return True
-        if value.lower() in ('false', '0', 'no'):
+        if lowered in FALSE_VALUES:
             return False
         
         # Try integer
@@ -99,16 +395,19 @@ class Config:
         
         return value
     
-    def _trim_config_values(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively trim whitespace from string values in configuration."""
+    def _trim_config_values(self, config: Any):
+        """Recursively trim whitespace from string values in configuration, in place."""
         if isinstance(config, dict):
-            return {k: self._trim_config_values(v) for k, v in config.items()}
+            items = config.items()
         elif isinstance(config, list):
-            return [self._trim_config_values(item) for item in config]
-        elif isinstance(config, str):
-            return config.strip()
+            items = enumerate(config)
         else:
-            return config
+            return
+        for k, v in items:
+            if isinstance(v, str):
+                config[k] = v.strip()
+            elif isinstance(v, (dict, list)):
+                self._trim_config_values(v)
     
     def _set_nested(self, d: Dict, key: str, value: Any):
         """Set nested dictionary value."""
@@ -119,146 +418,85 @@ class Config:
     
     def _load_from_cli(self, args: argparse.Namespace):
         """Load configuration from CLI arguments."""
-        if args.memgraph_host:
-            if 'memgraph' not in self.config:
-                self.config['memgraph'] = {}
-            self.config['memgraph']['host'] = args.memgraph_host.strip() if isinstance(args.memgraph_host, str) else args.memgraph_host
-        
-        if args.memgraph_port:
-            if 'memgraph' not in self.config:
-                self.config['memgraph'] = {}
-            self.config['memgraph']['port'] = args.memgraph_port
-        
-        if args.memgraph_username:
-            if 'memgraph' not in self.config:
-                self.config['memgraph'] = {}
-            self.config['memgraph']['username'] = args.memgraph_username.strip() if isinstance(args.memgraph_username, str) else args.memgraph_username
-        
-        if args.memgraph_password:
-            if 'memgraph' not in self.config:
-                self.config['memgraph'] = {}
-            self.config['memgraph']['password'] = args.memgraph_password.strip() if isinstance(args.memgraph_password, str) else args.memgraph_password
-        
-        if args.opensearch_host:
-            if 'opensearch' not in self.config:
-                self.config['opensearch'] = {}
-            self.config['opensearch']['host'] = args.opensearch_host.strip() if isinstance(args.opensearch_host, str) else args.opensearch_host
-        
-        if args.opensearch_use_ssl is not None:
-            if 'opensearch' not in self.config:
-                self.config['opensearch'] = {}
-            self.config['opensearch']['use_ssl'] = args.opensearch_use_ssl
-        
-        if args.opensearch_verify_certs is not None:
-            if 'opensearch' not in self.config:
-                self.config['opensearch'] = {}
-            self.config['opensearch']['verify_certs'] = args.opensearch_verify_certs
-        
-        if args.opensearch_username:
-            if 'opensearch' not in self.config:
-                self.config['opensearch'] = {}
-            self.config['opensearch']['username'] = args.opensearch_username.strip() if isinstance(args.opensearch_username, str) else args.opensearch_username
-        
-        if args.opensearch_password:
-            if 'opensearch' not in self.config:
-                self.config['opensearch'] = {}
-            self.config['opensearch']['password'] = args.opensearch_password.strip() if isinstance(args.opensearch_password, str) else args.opensearch_password
-        
-        if args.index_spec_file:
-            self.config['index_spec_file'] = args.index_spec_file.strip() if isinstance(args.index_spec_file, str) else args.index_spec_file
-        
-        # Use getattr to handle argparse.SUPPRESS (attribute won't exist if flag not provided)
-        if hasattr(args, 'clear_existing_indices'):
-            self.config['clear_existing_indices'] = args.clear_existing_indices
-        
-        if hasattr(args, 'allow_index_creation'):
-            self.config['allow_index_creation'] = args.allow_index_creation
-        
-        if args.selected_indices:
-            # Handle comma-separated list from CLI and trim each value
-            if isinstance(args.selected_indices, str):
-                self.config['selected_indices'] = [v.strip() for v in args.selected_indices.split(',') if v.strip()]
-            elif isinstance(args.selected_indices, list):
-                self.config['selected_indices'] = [v.strip() if isinstance(v, str) else v for v in args.selected_indices]
-        
-        if args.about_file:
-            self.config['about_file'] = args.about_file.strip() if isinstance(args.about_file, str) else args.about_file
-        
-        if args.model_files:
-            # Handle comma-separated list from CLI and trim each value
-            if isinstance(args.model_files, str):
-                self.config['model_files'] = [v.strip() for v in args.model_files.split(',') if v.strip()]
-            elif isinstance(args.model_files, list):
-                self.config['model_files'] = [v.strip() if isinstance(v, str) else v for v in args.model_files]
-        
-        # Use hasattr to handle argparse.SUPPRESS (attribute won't exist if flag not provided)
-        if hasattr(args, 'test_mode'):
-            self.config['test_mode'] = args.test_mode
+        for attr, path, kind in CLI_MAPPING:
+            # Flags that were not provided are None (or absent)
+            value = getattr(args, attr, None)
+            if kind == 'bool':
+                if value is None:
+                    continue
+            elif not value:
+                continue
+            elif kind == 'list':
+                # Handle comma-separated list from CLI and trim each value
+                if isinstance(value, str):
+                    value = [v.strip() for v in value.split(',') if v.strip()]
+                elif isinstance(value, list):
+                    value = [v.strip() if isinstance(v, str) else v for v in value]
+                else:
+                    continue
+            
+            if len(path) == 1:
+                self.config[path[0]] = value
+            else:
+                self.config.setdefault(path[0], {})[path[1]] = value
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
         return self.config.get(key, default)
     
-    def get_memgraph_config(self) -> Dict[str, Any]:
+    def get_memgraph_config(self) -> Mapping[str, Any]:
         """Get Memgraph configuration."""
-        return self.config.get('memgraph', {})
+        return self._resolved.memgraph
     
-    def get_opensearch_config(self) -> Dict[str, Any]:
+    def get_opensearch_config(self) -> Mapping[str, Any]:
         """Get OpenSearch configuration."""
-        return self.config.get('opensearch', {})
+        return self._resolved.opensearch
     
     def get_index_spec_file(self) -> Optional[str]:
         """Get index specification file path."""
-        return self.config.get('index_spec_file')
+        return self._resolved.index_spec_file
     
     def get_clear_existing_indices(self) -> bool:
         """Get clear_existing_indices setting."""
-        return self.config.get('clear_existing_indices', False)
+        return self._resolved.clear_existing_indices
     
     def get_allow_index_creation(self) -> bool:
         """Get allow_index_creation setting."""
-        return self.config.get('allow_index_creation', True)
+        return self._resolved.allow_index_creation
     
-    def get_selected_indices(self) -> Optional[List[str]]:
+    def get_selected_indices(self) -> Optional[Tuple[str, ...]]:
         """Get selected_indices setting.
         
-        Returns a list of index names with whitespace trimmed, or None if not set or empty.
+        Returns a tuple of index names with whitespace trimmed, or None if not set or empty.
         If None is returned, all indices should be processed.
         """
-        selected = self.config.get('selected_indices')
-        if selected is None:
-            return None
-        
-        # Ensure it's a list and trim each value
-        if isinstance(selected, list):
-            # If empty list is provided, return None to process all indices
-            if not selected:
-                return None
-            # Trim each index name and filter out empty strings
-            trimmed = [v.strip() if isinstance(v, str) else str(v).strip() for v in selected if v]
-            # If all values were empty strings, return None to process all indices
-            return trimmed if trimmed else None
-        elif isinstance(selected, str):
-            # Handle string case (shouldn't happen with proper config, but defensive)
-            trimmed = selected.strip()
-            return [trimmed] if trimmed else None
+        return self._resolved.selected_indices
+    
+    @functools.cached_property
+    def _selected_set(self) -> Optional[FrozenSet[str]]:
+        """Selected index names as a frozenset for O(1) membership tests."""
+        selected = self.get_selected_indices()
+        return frozenset(selected) if selected else None
+    
+    def is_selected(self, index_name: str) -> bool:
+        """Check whether an index should be processed.
         
-        return None
+        Args:
+            index_name: Name of the index (already trimmed)
+            
+        Returns:
+            True if no selection is configured or the index is in selected_indices
+        """
+        selected = self._selected_set
+        return selected is None or index_name in selected
     
     def get_about_file(self) -> Optional[str]:
         """Get about_file path."""
-        return self.config.get('about_file')
+        return self._resolved.about_file
     
-    def get_model_files(self) -> Optional[List[str]]:
+    def get_model_files(self) -> Optional[Tuple[str, ...]]:
         """Get model_files list."""
-        model_files = self.config.get('model_files')
-        if model_files is None:
-            return None
-        if isinstance(model_files, list):
-            return [v.strip() if isinstance(v, str) else str(v).strip() for v in model_files if v]
-        elif isinstance(model_files, str):
-            return [model_files.strip()] if model_files.strip() else None
-        return None
+        return self._resolved.model_files
     
     def get_test_mode(self) -> bool:
         """Get test_mode setting.
@@ -269,11 +507,120 @@ class Config:
         Returns:
             True if test_mode is enabled, False otherwise (default).
         """
-        return self.config.get('test_mode', False)
+        return self._resolved.test_mode
+    
+    def get_max_index_workers(self) -> int:
+        """Get max_index_workers setting.
+        
+        Number of indices processed concurrently (default: 2, so one index's
+        update queries typically overlap the next index's initial load).
+        1 processes indices sequentially in specification order.
+        """
+        return self._resolved.max_index_workers
+    
+    def get_bulk_workers(self) -> int:
+        """Get bulk_workers setting.
+        
+        Maximum number of concurrent OpenSearch bulk requests per query (default: 4).
+        """
+        return self._resolved.bulk_workers
+    
+    def get_target_bulk_docs(self) -> int:
+        """Get target_bulk_docs setting.
+        
+        Consecutive small query pages are merged into one bulk request until it
+        holds this many documents, and larger pages are split (default: 5000).
+        """
+        return self._resolved.target_bulk_docs
+    
+    def get_target_bulk_bytes(self) -> int:
+        """Get target_bulk_bytes setting.
+        
+        Consecutive small query pages are merged into one bulk request until its
+        estimated JSON size reaches this many bytes, and larger pages are split
+        (default: 50 MB).
+        """
+        return self._resolved.target_bulk_bytes
+    
+    def get_stream_queries(self) -> bool:
+        """Get stream_queries setting.
+        
+        If True, paginated Memgraph queries run once with an unbounded $limit and
+        are read in page_size batches via the driver's fetch_size (default: False).
+        """
+        return self._resolved.stream_queries
+    
+    def get_tune_for_bulk(self) -> bool:
+        """Get tune_for_bulk setting.
+        
+        If True (default), query indices have refresh disabled and replicas set
+        to 0 while they are loaded, and the original settings restored afterwards.
+        """
+        return self._resolved.tune_for_bulk
+    
+    def get_prefetch_pages(self) -> int:
+        """Get prefetch_pages setting.
+        
+        Number of Memgraph pages fetched ahead of the page being written to
+        OpenSearch (default: 2). Bounds the memory held by the read-ahead.
+        """
+        return self._resolved.prefetch_pages
+    
+    def get_adaptive_bulk_size(self) -> bool:
+        """Get adaptive_bulk_size setting.
+        
+        If True, the number of documents per query bulk request starts at
+        target_bulk_docs and is adjusted per query from observed bulk request
+        durations (default: False).
+        """
+        return self._resolved.adaptive_bulk_size
+    
+    def get_bulk_latency_target(self) -> float:
+        """Get bulk_latency_target setting.
+        
+        Bulk request duration in seconds below which the adaptive bulk size
+        grows, and above which it is halved (default: 2.0).
+        """
+        return self._resolved.bulk_latency_target
+    
+    def get_bulk_retry_attempts(self) -> int:
+        """Get bulk_retry_attempts setting.
+        
+        Maximum number of attempts for a bulk request failing with a transient
+        error (throttling, gateway errors, connection errors), with exponential
+        backoff between attempts (default: 3).
+        """
+        return self._resolved.bulk_retry_attempts
+    
+    def get_alias_swap(self) -> bool:
+        """Get alias_swap setting.
+        
+        If True, each query index is loaded into a new timestamped index and its
+        name is then pointed at it as an alias, replacing the previous index
+        atomically (default: False).
+        """
+        return self._resolved.alias_swap
+    
+    def get_strict_mapping(self) -> bool:
+        """Get strict_mapping setting.
+        
+        If True, query indices are created with strict dynamic mapping, so
+        OpenSearch rejects documents with unmapped fields, and query results are
+        not validated against the mapping beforehand (default: False). Existing
+        indices that this run does not create are still validated.
+        """
+        return self._resolved.strict_mapping
 
 
 def load_index_spec(index_spec_file: str) -> Dict[str, Any]:
-    """Load index specification from YAML file."""
-    with open(index_spec_file, 'r') as f:
-        return yaml.safe_load(f) or {}
+    """Load index specification from YAML file, reusing the on-disk cache when fresh."""
+    st = os.stat(index_spec_file)
+    spec = _read_config_cache(index_spec_file, st)
+    if spec is not None:
+        logger.debug(f"Using cached index specification for {index_spec_file}")
+        return spec
+    
+    spec = load_yaml_file(index_spec_file) or {}
+    _write_config_cache(index_spec_file, st, spec)
+    return spec
 
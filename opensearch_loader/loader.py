@@ -1,24 +1,214 @@
 """Main loader orchestration logic."""
 
 import logging
+import random
+import threading
 import time
 import os
-import yaml
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from itertools import islice
+from typing import Callable, Dict, Any, FrozenSet, Iterator, List, Optional, Set, Tuple, Union
 from pathlib import Path
-from collections import defaultdict
 
-from .config import Config, load_index_spec
+from opensearchpy.exceptions import TransportError, ConnectionError as OpenSearchConnectionError
+from opensearchpy.helpers import BulkIndexError
+
+from .config import Config, iter_yaml_sequence, load_index_spec
 from .memgraph_client import MemgraphClient
-from .opensearch_client import OpenSearchClient
+from .opensearch_client import OpenSearchClient, BULK_CHUNK_BYTES, BULK_CHUNK_DOCS, DEFAULT_POOL_MAXSIZE
+from .pipeline import AdaptiveBulkSize, BulkSubmitter, QueryTimer, RunningTotal, coalesce_pages, prefetch
 
 logger = logging.getLogger("OpenSearchLoader")
 
+# Bulk requests failing with these HTTP statuses (throttled / bad gateway / unavailable / gateway
+# timeout) are retried; attempts are set by Config.get_bulk_retry_attempts
+RETRYABLE_STATUS_CODES = frozenset((429, 502, 503, 504))
+BULK_RETRY_BASE_DELAY = 0.5  # seconds
+
+# Index settings applied while a query index is loaded (see Config.get_tune_for_bulk)
+BULK_LOAD_SETTINGS = {"refresh_interval": "-1", "number_of_replicas": 0}
+
+# Row layout of the loading summary: index name, documents, time
+SUMMARY_ROW_FMT = "{:<40} {:<15} {:<15}"
+
+# Page size used when a query does not set one
+DEFAULT_PAGE_SIZE = 10000
+
+# Field types accepted in an index's mapping configuration
+VALID_MAPPING_TYPES = frozenset({'keyword', 'text', 'search_as_you_type', 'long', 'integer',
+                                 'double', 'float', 'boolean', 'date', 'object'})
+
+# Mapping for about file indices that do not configure one
+DEFAULT_ABOUT_MAPPING = {
+    'page': {'type': 'search_as_you_type'},
+    'title': {'type': 'search_as_you_type'},
+    'primaryContentImage': {'type': 'text'},
+    'content': {'type': 'object'}
+}
+
+# Mappings for model indices that do not configure one, by subtype
+DEFAULT_MODEL_MAPPINGS = {
+    'node': {
+        'node': {'type': 'search_as_you_type'},
+        'node_kw': {'type': 'keyword'}
+    },
+    'property': {
+        'node': {'type': 'search_as_you_type'},
+        'property': {'type': 'search_as_you_type'},
+        'property_kw': {'type': 'keyword'},
+        'property_description': {'type': 'search_as_you_type'},
+        'property_required': {'type': 'search_as_you_type'},
+        'property_type': {'type': 'search_as_you_type'}
+    },
+    'value': {
+        'node': {'type': 'search_as_you_type'},
+        'property': {'type': 'search_as_you_type'},
+        'property_description': {'type': 'search_as_you_type'},
+        'property_required': {'type': 'search_as_you_type'},
+        'property_type': {'type': 'search_as_you_type'},
+        'value': {'type': 'search_as_you_type'},
+        'value_kw': {'type': 'keyword'}
+    }
+}
+
+# Field validation samples at most this many documents from the first page, stopping early
+# once a block of VALIDATION_SAMPLE_BLOCK documents adds no new field names
+VALIDATION_SAMPLE_DOCS = 64
+VALIDATION_SAMPLE_BLOCK = 16
+
+
+@dataclass(frozen=True, slots=True)
+class UpdatePlan:
+    """Validated update query of a query-based index."""
+    name: str
+    query: str
+    variables: Dict[str, Any]
+    page_size: int
+    cursor_field: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class IndexPlan:
+    """Validated configuration of a query-based index, built before any loading starts."""
+    index_name: str
+    id_field: str
+    mapping: Dict[str, Any]
+    mapped_fields: FrozenSet[str]  # Field names in the mapping, for validating query results
+    initial_query: str
+    initial_vars: Dict[str, Any]
+    initial_page_size: int
+    update_plans: Tuple[UpdatePlan, ...]
+    initial_cursor_field: Optional[str] = None
+
+
+@dataclass(slots=True)
+class QueryTiming:
+    """Running aggregate of a query's Memgraph execution times."""
+    count: int = 0
+    total: float = 0.0
+    min: float = float('inf')
+    max: float = 0.0
+    
+    def record(self, seconds: float):
+        """Add one execution time."""
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Check whether a failed bulk request is worth retrying as a whole.
+    
+    Connection errors and RETRYABLE_STATUS_CODES responses are retryable, as is a
+    BulkIndexError whose failed items were all rejected with 429 (queue full).
+    Item-level failures such as mapping errors or missing documents are not.
+    """
+    if isinstance(error, BulkIndexError):
+        return bool(error.errors) and all(
+            next(iter(item.values()), {}).get('status') == 429 for item in error.errors
+        )
+    return isinstance(error, OpenSearchConnectionError) or error.status_code in RETRYABLE_STATUS_CODES
+
+
+def _mapped_field_names(mapping: Dict[str, Dict[str, Any]]) -> FrozenSet[str]:
+    """Flatten a parsed mapping into the set of field names it maps, in dot notation.
+    
+    Object fields with properties contribute both the object name and each
+    "object.property"; other fields contribute their name.
+    """
+    names = []
+    for field_name, field_config in mapping.items():
+        names.append(field_name)
+        if field_config.get('type') == 'object' and 'properties' in field_config:
+            names.extend(f"{field_name}.{prop}" for prop in field_config['properties'])
+    return frozenset(names)
+
+
+def _strict_mapping_reason(error: Exception) -> Optional[str]:
+    """Return the reason of the first document rejected by a strict mapping, if any.
+    
+    With strict_mapping, OpenSearch names the unmapped field in the reason, e.g.
+    "mapping set to strict, dynamic introduction of [x] within [_doc] is not allowed".
+    """
+    if isinstance(error, BulkIndexError):
+        for item in error.errors:
+            item_error = next(iter(item.values()), {}).get('error') or {}
+            if item_error.get('type') == 'strict_dynamic_mapping_exception':
+                return item_error.get('reason')
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeOpts:
+    """Settings read on every index, snapshotted from the configuration once per loader."""
+    clear_existing: bool
+    allow_create: bool
+    tune_for_bulk: bool
+    test_mode: bool
+    max_index_workers: int
+    bulk_workers: int
+    target_bulk_docs: int
+    target_bulk_bytes: int
+    prefetch_pages: int
+    adaptive_bulk_size: bool
+    bulk_latency_target: float
+    bulk_retry_attempts: int
+    alias_swap: bool
+    strict_mapping: bool
+    
+    @classmethod
+    def from_config(cls, config: Config) -> 'RuntimeOpts':
+        """Snapshot the settings from a configuration."""
+        return cls(
+            clear_existing=bool(config.get_clear_existing_indices()),
+            allow_create=bool(config.get_allow_index_creation()),
+            tune_for_bulk=bool(config.get_tune_for_bulk()),
+            test_mode=bool(config.get_test_mode()),
+            max_index_workers=config.get_max_index_workers(),
+            bulk_workers=config.get_bulk_workers(),
+            target_bulk_docs=config.get_target_bulk_docs(),
+            target_bulk_bytes=config.get_target_bulk_bytes(),
+            prefetch_pages=config.get_prefetch_pages(),
+            adaptive_bulk_size=bool(config.get_adaptive_bulk_size()),
+            bulk_latency_target=config.get_bulk_latency_target(),
+            bulk_retry_attempts=config.get_bulk_retry_attempts(),
+            alias_swap=bool(config.get_alias_swap()),
+            strict_mapping=bool(config.get_strict_mapping()),
+        )
+
 
 class Loader:
     """Main loader that orchestrates data synchronization."""
     
+    __slots__ = ('config', 'opts', 'memgraph', 'opensearch', 'index_stats', 'query_timings',
+                 '_timings_lock', 'model', '_model_props', '_run_timestamp', '_index_suffix', '_logs_dir',
+                 '_bulk_executor')
+    
     def __init__(self, config: Config):
         """Initialize loader with configuration.
         
@@ -26,6 +216,10 @@ class Loader:
             config: Configuration object
         """
         self.config = config
+        self.opts = RuntimeOpts.from_config(config)
+        
+        # Bulk request threads across all concurrently processed indices
+        bulk_threads = self.opts.bulk_workers * self.opts.max_index_workers
         
         # Initialize Memgraph client
         mg_config = config.get_memgraph_config()
@@ -33,7 +227,10 @@ class Loader:
             host=mg_config.get('host', 'localhost'),
             port=mg_config.get('port', 7687),
             username=mg_config.get('username'),
-            password=mg_config.get('password')
+            password=mg_config.get('password'),
+            stream_queries=config.get_stream_queries(),
+            max_connection_pool_size=mg_config.get('max_connection_pool_size'),
+            connection_acquisition_timeout=mg_config.get('connection_acquisition_timeout')
         )
         
         # Initialize OpenSearch client
@@ -44,20 +241,55 @@ class Loader:
             use_ssl=os_config.get('use_ssl', False),
             verify_certs=os_config.get('verify_certs', False),
             username=os_config.get('username'),
-            password=os_config.get('password')
+            password=os_config.get('password'),
+            # Keep a pooled connection per bulk thread so none are opened and dropped per request
+            pool_maxsize=os_config.get('pool_maxsize', max(DEFAULT_POOL_MAXSIZE, bulk_threads)),
+            http_compress=os_config.get('http_compress', True),
+            bulk_chunk_size=int(os_config.get('bulk_chunk_size') or BULK_CHUNK_DOCS),
+            bulk_max_bytes=int(os_config.get('bulk_max_bytes') or BULK_CHUNK_BYTES)
         )
         
         # Statistics tracking
         self.index_stats: List[Dict[str, Any]] = []
-        # Query timing: key is "index:query_name", value is list of execution times
-        self.query_timings: Dict[str, List[float]] = defaultdict(list)
+        # Query timing: key is "index:query_name"
+        self.query_timings: Dict[str, QueryTiming] = {}
+        # Guards query_timings when indices are processed concurrently
+        self._timings_lock = threading.Lock()
         
         # Model instance (initialized if model_files are configured)
         self.model = None
+        # Non-relationship properties per model node, built on first use (see _model_properties)
+        self._model_props = None
+        
+        # Summary and timing files of one run share a timestamp; alias_swap indices are suffixed with it
+        # plus a random token, so runs started in the same second do not pick the same index names
+        started = datetime.now()
+        self._run_timestamp = started.strftime("%Y%m%d-%H:%M")
+        self._index_suffix = f"{started:%Y%m%d%H%M%S}-{random.getrandbits(24):06x}"
+        self._logs_dir = Path("logs")
+        self._logs_dir.mkdir(exist_ok=True)
+        
+        # Shared pool for overlapped bulk requests; each concurrently processed index gets its share
+        self._bulk_executor = ThreadPoolExecutor(
+            max_workers=bulk_threads,
+            thread_name_prefix='bulk'
+        )
     
     def close(self):
         """Close all client connections."""
-        self.memgraph.close()
+        try:
+            self._bulk_executor.shutdown(wait=True)
+        finally:
+            try:
+                self.memgraph.close()
+            finally:
+                self.opensearch.close()
+    
+    def __enter__(self) -> 'Loader':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def _format_time(self, seconds: float) -> str:
         """Format seconds into minutes:seconds format.
@@ -71,8 +303,7 @@ class Loader:
         if seconds < 0:
             return "N/A"
         
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
+        minutes, secs = divmod(int(seconds), 60)
         
         if minutes > 0:
             return f"{minutes}m {secs}s"
@@ -102,10 +333,10 @@ class Loader:
         if not index_spec_file:
             raise ValueError("index_spec_file not specified in configuration")
         
-        if not Path(index_spec_file).exists():
-            raise FileNotFoundError(f"Index specification file not found: {index_spec_file}")
-        
-        index_spec = load_index_spec(index_spec_file)
+        try:
+            index_spec = load_index_spec(index_spec_file)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Index specification file not found: {index_spec_file}") from e
         indices = index_spec.get('indices', [])
         
         if not indices:
@@ -116,33 +347,28 @@ class Loader:
         # This filtering applies to ALL index types: query-based, about_file, and model indices
         selected_indices = self.config.get_selected_indices()
         if selected_indices:
-            # Trim all selected index names (defensive trimming)
-            selected_set = {name.strip() for name in selected_indices if name}
-            
-            # Create a map of index_name to index_config for efficient lookup
-            index_map = {}
+            # Single pass: keep selected indices and note which selected names were found
+            # This applies to all index types (query-based, about_file, model)
+            filtered_indices = []
+            seen = set()
+            is_selected = self.config.is_selected
             for index_config in indices:
-                index_name = index_config.get('index_name')
-                if index_name:
-                    # Trim index name for comparison
-                    trimmed_name = index_name.strip()
-                    index_map[trimmed_name] = index_config
+                index_name = (index_config.get('index_name') or '').strip()
+                if is_selected(index_name):
+                    filtered_indices.append(index_config)
+                    seen.add(index_name)
             
-            # Check for selected indices that don't exist and log warnings
-            for selected_name in selected_set:
-                if selected_name not in index_map:
+            # Warn about selected indices that don't exist (in selection order)
+            # Names are already trimmed and de-duplicated by Config
+            for selected_name in selected_indices:
+                if selected_name not in seen:
                     logger.warning(f"Selected index '{selected_name}' does not exist in indices file. Skipping.")
             
-            # Filter indices to only those in selected_set
-            # This applies to all index types (query-based, about_file, model)
-            filtered_indices = [index_config for index_config in indices 
-                              if index_config.get('index_name', '').strip() in selected_set]
-            
             if not filtered_indices:
                 logger.warning("No valid indices found after filtering. Nothing to process.")
                 return
             
-            logger.info(f"Filtering enabled: {len(selected_set)} index(es) selected, {len(filtered_indices)} will be processed")
+            logger.info(f"Filtering enabled: {len(selected_indices)} index(es) selected, {len(filtered_indices)} will be processed")
             indices = filtered_indices
         else:
             logger.info(f"Processing all {len(indices)} indices")
@@ -160,39 +386,24 @@ class Loader:
             else:
                 logger.debug("Model files configured but no model indices in selected/filtered indices, skipping model initialization")
         
+        # Validate query-based indices up front, before any Memgraph/OpenSearch work
+        plans = self._build_plans(indices)
+        
         start_time = time.time()
         
-        # Process each index
-        for index_config in indices:
-            index_name = index_config.get('index_name', 'unknown')
-            index_start_time = time.time()
-            
-            try:
-                document_count = self._process_index(index_config)
-                index_end_time = time.time()
-                index_duration = index_end_time - index_start_time
-                
-                # Record successful index statistics
-                self.index_stats.append({
-                    'index_name': index_name,
-                    'document_count': document_count,
-                    'duration': index_duration,
-                    'error': False
-                })
-            except Exception as e:
-                index_end_time = time.time()
-                index_duration = index_end_time - index_start_time
-                error_occurred = True
-                logger.error(f"Error processing index {index_name}: {e}. Skipping to next index.")
-                
-                # Record failed index statistics
-                self.index_stats.append({
-                    'index_name': index_name,
-                    'document_count': 'ERROR',
-                    'duration': index_duration,
-                    'error': True
-                })
-                continue
+        # Process each index. Indices are independent, so they can run concurrently;
+        # stats are always recorded in specification order.
+        max_workers = min(self.opts.max_index_workers, len(indices))
+        if max_workers <= 1:
+            for index_config, plan in zip(indices, plans):
+                self.index_stats.append(self._run_index(index_config, plan))
+        else:
+            logger.info(f"Processing indices with {max_workers} parallel workers")
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='index') as executor:
+                futures = [executor.submit(self._run_index, index_config, plan)
+                           for index_config, plan in zip(indices, plans)]
+                for future in futures:
+                    self.index_stats.append(future.result())
         
         total_time = time.time() - start_time
         
@@ -202,81 +413,177 @@ class Loader:
         # Save query timings
         self._save_query_timings()
     
-    def _process_index(self, index_config: Dict[str, Any]) -> int:
-        """Process a single index.
+    def _build_plans(self, indices: List[Dict[str, Any]]) -> List[Union[IndexPlan, ValueError, None]]:
+        """Build an IndexPlan for every query-based index.
+        
+        Args:
+            indices: Index configuration dictionaries
+            
+        Returns:
+            One entry per index: its IndexPlan, the ValueError that made its
+            configuration invalid, or None for about_file and model indices
+        """
+        plans: List[Union[IndexPlan, ValueError, None]] = []
+        for index_config in indices:
+            if index_config.get('type') in ('about_file', 'model'):
+                plans.append(None)
+                continue
+            try:
+                plans.append(self._build_plan(index_config))
+            except ValueError as e:
+                plans.append(e)
+        return plans
+    
+    def _build_plan(self, index_config: Dict[str, Any]) -> IndexPlan:
+        """Validate a query-based index configuration and build its plan.
         
         Args:
             index_config: Index configuration dictionary
             
         Returns:
-            Number of documents loaded
+            IndexPlan for the index
+            
+        Raises:
+            ValueError: If a required setting is missing or invalid
         """
         index_name = index_config.get('index_name')
         if not index_name:
             raise ValueError("index_name is required in index configuration")
         
-        index_type = index_config.get('type')
+        id_field = index_config.get('id_field')
+        if not id_field:
+            raise ValueError("id_field is required in index configuration")
         
-        logger.info(f"Starting index: {index_name}")
+        # REQUIRE mapping
+        mapping_config = index_config.get('mapping')
+        if not mapping_config:
+            raise ValueError(f"Index {index_name} is missing required 'mapping' configuration")
+        try:
+            mapping = self._parse_mapping(mapping_config)
+        except ValueError as e:
+            raise ValueError(f"Index {index_name}: Invalid mapping configuration: {e}") from e
         
-        # Route to appropriate handler based on index type
-        if index_type == 'about_file':
-            return self._process_about_file_index(index_config)
-        elif index_type == 'model':
-            return self._process_model_index(index_config)
-        else:
-            # Default: treat as query-based index
-            return self._process_query_index(index_config)
+        initial_query_config = index_config.get('initial_query')
+        if not initial_query_config:
+            raise ValueError(f"initial_query is required for index {index_name}")
+        
+        query = initial_query_config.get('query')
+        if not query:
+            raise ValueError(f"initial_query.query is required for index {index_name}")
+        
+        update_plans = []
+        for update_query_config in index_config.get('update_queries') or []:
+            query_name = update_query_config.get('name')
+            update_query = update_query_config.get('query')
+            if not update_query:
+                query_display = query_name if query_name else 'unnamed'
+                logger.warning(f"Update query '{query_display}' missing query, skipping")
+                continue
+            
+            # Warn if query name is missing
+            if not query_name:
+                logger.warning(f"{index_name}: Update query missing name, proceeding without query name prefix")
+                query_name = "unnamed"
+            
+            update_plans.append(UpdatePlan(
+                name=query_name,
+                query=update_query,
+                variables=update_query_config.get('variables') or {},
+                page_size=self._page_size(index_name, update_query_config),
+                cursor_field=update_query_config.get('cursor_field')
+            ))
+        
+        return IndexPlan(
+            index_name=index_name,
+            id_field=id_field,
+            mapping=mapping,
+            mapped_fields=_mapped_field_names(mapping),
+            initial_query=query,
+            initial_vars=initial_query_config.get('variables') or {},
+            initial_page_size=self._page_size(index_name, initial_query_config),
+            update_plans=tuple(update_plans),
+            initial_cursor_field=initial_query_config.get('cursor_field')
+        )
+    
+    def _page_size(self, index_name: str, query_config: Dict[str, Any]) -> int:
+        """Read a query's page_size as a positive int (default: DEFAULT_PAGE_SIZE)."""
+        page_size = query_config.get('page_size', DEFAULT_PAGE_SIZE)
+        try:
+            page_size = int(page_size)
+        except (TypeError, ValueError):
+            page_size = 0
+        if page_size <= 0:
+            raise ValueError(f"Index {index_name}: page_size must be a positive integer, got {query_config.get('page_size')!r}")
+        return page_size
     
-    def _get_default_about_mapping(self) -> Dict[str, Any]:
-        """Get default mapping for about file indices.
+    def _run_index(self, index_config: Dict[str, Any],
+                   plan: Union[IndexPlan, ValueError, None] = None) -> Dict[str, Any]:
+        """Process a single index and build its statistics entry.
+        
+        Errors are logged and recorded rather than raised, so one failing
+        index does not stop the others.
         
+        Args:
+            index_config: Index configuration dictionary
+            plan: Entry from _build_plans for this index
+            
         Returns:
-            Default mapping dictionary
+            Statistics dictionary for the summary
         """
+        index_name = index_config.get('index_name', 'unknown')
+        index_start_time = time.time()
+        
+        try:
+            if isinstance(plan, ValueError):
+                raise plan
+            document_count = self._process_index(index_config, plan)
+            error = False
+        except Exception as e:
+            logger.error(f"Error processing index {index_name}: {e}. Skipping to next index.")
+            document_count = 'ERROR'
+            error = True
+        
         return {
-            'page': {'type': 'search_as_you_type'},
-            'title': {'type': 'search_as_you_type'},
-            'primaryContentImage': {'type': 'text'},
-            'content': {'type': 'object'}
+            'index_name': index_name,
+            'document_count': document_count,
+            'duration': time.time() - index_start_time,
+            'error': error
         }
     
-    def _get_default_model_mapping(self, subtype: str) -> Dict[str, Any]:
-        """Get default mapping for model indices based on subtype.
+    def _record_query_time(self, query_key: str, query_duration: float):
+        """Record a Memgraph query execution time (thread-safe)."""
+        with self._timings_lock:
+            timing = self.query_timings.get(query_key)
+            if timing is None:
+                timing = self.query_timings[query_key] = QueryTiming()
+            timing.record(query_duration)
+    
+    def _process_index(self, index_config: Dict[str, Any], plan: Optional[IndexPlan] = None) -> int:
+        """Process a single index.
         
         Args:
-            subtype: Model subtype ('node', 'property', or 'value')
+            index_config: Index configuration dictionary
+            plan: Validated plan for a query-based index (built here if not given)
             
         Returns:
-            Default mapping dictionary
+            Number of documents loaded
         """
-        if subtype == 'node':
-            return {
-                'node': {'type': 'search_as_you_type'},
-                'node_kw': {'type': 'keyword'}
-            }
-        elif subtype == 'property':
-            return {
-                'node': {'type': 'search_as_you_type'},
-                'property': {'type': 'search_as_you_type'},
-                'property_kw': {'type': 'keyword'},
-                'property_description': {'type': 'search_as_you_type'},
-                'property_required': {'type': 'search_as_you_type'},
-                'property_type': {'type': 'search_as_you_type'}
-            }
-        elif subtype == 'value':
-            return {
-                'node': {'type': 'search_as_you_type'},
-                'property': {'type': 'search_as_you_type'},
-                'property_description': {'type': 'search_as_you_type'},
-                'property_required': {'type': 'search_as_you_type'},
-                'property_type': {'type': 'search_as_you_type'},
-                'value': {'type': 'search_as_you_type'},
-                'value_kw': {'type': 'keyword'}
-            }
+        index_name = index_config.get('index_name')
+        if not index_name:
+            raise ValueError("index_name is required in index configuration")
+        
+        index_type = index_config.get('type')
+        
+        logger.info(f"Starting index: {index_name}")
+        
+        # Route to appropriate handler based on index type
+        if index_type == 'about_file':
+            return self._process_about_file_index(index_config)
+        elif index_type == 'model':
+            return self._process_model_index(index_config)
         else:
-            # Unknown subtype, return empty mapping
-            return {}
+            # Default: treat as query-based index
+            return self._process_query_index(plan or self._build_plan(index_config))
     
     def _parse_mapping(self, mapping_config: Dict[str, List[str]]) -> Dict[str, Dict[str, Any]]:
         """Convert grouped YAML format to OpenSearch mapping format.
@@ -289,7 +596,8 @@ class Loader:
                 Example: {'keyword': ['field1', 'content.title'], 'text': ['content.paragraph']}
             
         Returns:
-            Dictionary in OpenSearch mapping format
+            Dictionary in OpenSearch mapping format. Fields of the same type share
+            one {'type': ...} definition dict, so treat the result as read-only.
                 Example: {
                     'field1': {'type': 'keyword'},
                     'content': {
@@ -307,21 +615,20 @@ class Loader:
         if not mapping_config:
             raise ValueError("Mapping configuration cannot be empty")
         
-        # Valid OpenSearch field types
-        valid_types = {'keyword', 'text', 'search_as_you_type', 'long', 'integer', 
-                      'double', 'float', 'boolean', 'date', 'object'}
-        
         result = {}
         nested_fields = {}  # Track nested properties by parent object
+        all_seen = set()  # Every field name defined so far, in dot notation
         
         # Process each type and its fields
         for field_type, fields in mapping_config.items():
             if not isinstance(fields, list):
                 raise ValueError(f"Fields for type '{field_type}' must be a list")
             
-            if field_type not in valid_types:
-                raise ValueError(f"Invalid field type '{field_type}'. Valid types: {valid_types}")
+            if field_type not in VALID_MAPPING_TYPES:
+                raise ValueError(f"Invalid field type '{field_type}'. Valid types: {sorted(VALID_MAPPING_TYPES)}")
             
+            # One definition shared by every field of this type
+            field_def = {'type': field_type}
             for field in fields:
                 if not isinstance(field, str) or not field.strip():
                     raise ValueError(f"Field name must be a non-empty string, got: {field}")
@@ -329,8 +636,9 @@ class Loader:
                 field = field.strip()
                 
                 # Check for duplicate fields
-                if field in result or any(field in nested.get('fields', set()) for nested in nested_fields.values()):
+                if field in all_seen:
                     raise ValueError(f"Duplicate field definition: '{field}'")
+                all_seen.add(field)
                 
                 # Check if this is a nested property (contains dot)
                 if '.' in field:
@@ -343,23 +651,20 @@ class Loader:
                     
                     # Track nested properties
                     if parent_obj not in nested_fields:
-                        nested_fields[parent_obj] = {'fields': set(), 'properties': {}}
-                    
-                    if prop_name in nested_fields[parent_obj]['fields']:
-                        raise ValueError(f"Duplicate nested property: '{field}'")
+                        # Check if parent object conflicts with a top-level field
+                        if parent_obj in result:
+                            raise ValueError(f"Cannot have both top-level field '{parent_obj}' and nested properties under '{parent_obj}.*'")
+                        nested_fields[parent_obj] = {'properties': {}}
                     
-                    nested_fields[parent_obj]['fields'].add(prop_name)
-                    nested_fields[parent_obj]['properties'][prop_name] = {'type': field_type}
+                    nested_fields[parent_obj]['properties'][prop_name] = field_def
                 else:
+                    if field in nested_fields:
+                        raise ValueError(f"Cannot have both top-level field '{field}' and nested properties under '{field}.*'")
                     # Top-level field
-                    result[field] = {'type': field_type}
+                    result[field] = field_def
         
         # Add nested objects to result
         for parent_obj, nested_info in nested_fields.items():
-            # Check if parent object conflicts with a top-level field
-            if parent_obj in result:
-                raise ValueError(f"Cannot have both top-level field '{parent_obj}' and nested properties under '{parent_obj}.*'")
-            
             result[parent_obj] = {
                 'type': 'object',
                 'properties': nested_info['properties']
@@ -370,92 +675,86 @@ class Loader:
         
         return result
     
-    def _validate_query_fields(self, index_name: str, documents: List[Dict[str, Any]], 
-                              mapping: Dict[str, Dict[str, Any]]) -> bool:
+    def _validate_query_fields(self, index_name: str, documents: List[Dict[str, Any]],
+                               mapped_fields: FrozenSet[str]) -> bool:
         """Validate that all fields in query results have mappings defined.
         
+        Only a sample of the documents is inspected: up to VALIDATION_SAMPLE_DOCS, and
+        fewer once VALIDATION_SAMPLE_BLOCK consecutive documents add no new field names.
+        This assumes query results are homogeneous, as every row of a Cypher query has
+        the same columns; a field that only appears in nested values of later documents
+        is not detected.
+        
         Args:
             index_name: Name of the index being validated
             documents: List of documents from query results (first page)
-            mapping: Parsed mapping dictionary (from _parse_mapping)
+            mapped_fields: Mapped field names (from _mapped_field_names)
             
         Returns:
-            True if all fields are mapped, False otherwise
+            True if all sampled fields are mapped, False otherwise
         """
         if not documents:
             return True  # No documents to validate
         
-        # Collect all field names from documents
-        all_fields = set()
-        for doc in documents:
-            all_fields.update(self._extract_field_names(doc))
-        
-        # Build a set of mapped field names (including nested properties)
-        mapped_fields = set()
-        nested_mappings = {}  # Track nested property mappings
-        
-        for field_name, field_config in mapping.items():
-            if field_config.get('type') == 'object' and 'properties' in field_config:
-                # This is a nested object - track its properties
-                parent = field_name
-                nested_mappings[parent] = set(field_config['properties'].keys())
-                # Add parent object itself (objects are implicit)
-                mapped_fields.add(parent)
-            else:
-                # Top-level field
-                mapped_fields.add(field_name)
-        
-        # Check each field
-        unmapped_fields = []
-        for field in all_fields:
-            if field in mapped_fields:
-                continue  # Field is directly mapped
-            
-            # Check if it's a nested property (e.g., "content.title")
-            if '.' in field:
-                parts = field.split('.')
-                if len(parts) == 2:
-                    parent, prop = parts[0], parts[1]
-                    if parent in nested_mappings and prop in nested_mappings[parent]:
-                        continue  # Nested property is mapped
-            
-            # Field is not mapped
-            unmapped_fields.append(field)
-        
+        # Collect field names from a sample of the documents
+        all_fields: Set[str] = set()
+        seen_count = 0
+        for i, doc in enumerate(islice(documents, VALIDATION_SAMPLE_DOCS), 1):
+            self._collect_field_names(doc, all_fields)
+            if i % VALIDATION_SAMPLE_BLOCK == 0:
+                if len(all_fields) == seen_count:
+                    break
+                seen_count = len(all_fields)
+        
+        unmapped_fields = [field for field in all_fields if field not in mapped_fields]
         if unmapped_fields:
             logger.error(f"Index {index_name}: Fields {unmapped_fields} returned by query but not found in mapping. Skipping index.")
             return False
         
         return True
     
-    def _extract_field_names(self, doc: Dict[str, Any], prefix: str = '') -> set:
-        """Recursively extract all field names from a document, including nested fields.
+    def _collect_field_names(self, doc: Dict[str, Any], out: Set[str]):
+        """Add all field names from a document, including nested fields, to out.
+        
+        Walks nested objects with an explicit stack rather than recursion. For a list
+        value, only its first element is inspected for nested fields.
         
         Args:
             doc: Document dictionary
-            prefix: Prefix for nested fields (used for recursion)
-            
-        Returns:
-            Set of field names (using dot notation for nested fields)
+            out: Set receiving the field names (using dot notation for nested fields)
         """
-        field_names = set()
+        stack = [(doc, '')]
+        while stack:
+            obj, prefix = stack.pop()
+            for key, value in obj.items():
+                field_name = f"{prefix}.{key}" if prefix else key
+                out.add(field_name)
+                
+                if isinstance(value, dict):
+                    stack.append((value, field_name))
+                # If value is a list, check its first element for nested objects
+                elif isinstance(value, list) and value and isinstance(value[0], dict):
+                    stack.append((value[0], field_name))
+    
+    def _mapping_or_default(self, index_config: Dict[str, Any],
+                            default: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Parse an index's mapping, or return the default one if none is configured.
         
-        for key, value in doc.items():
-            field_name = f"{prefix}.{key}" if prefix else key
-            field_names.add(field_name)
+        Args:
+            index_config: Index configuration dictionary
+            default: Default mapping (shared; not modified)
             
-            # If value is a dict, recursively extract nested fields
-            if isinstance(value, dict):
-                nested_fields = self._extract_field_names(value, field_name)
-                field_names.update(nested_fields)
-            # If value is a list, check if it contains objects
-            elif isinstance(value, list) and value:
-                # Check first element to see if it's a dict
-                if isinstance(value[0], dict):
-                    nested_fields = self._extract_field_names(value[0], field_name)
-                    field_names.update(nested_fields)
-        
-        return field_names
+        Returns:
+            Mapping dictionary, or None if the configured mapping is invalid (error logged)
+        """
+        mapping_config = index_config.get('mapping')
+        if not mapping_config:
+            return default
+        try:
+            return self._parse_mapping(mapping_config)
+        except ValueError as e:
+            logger.error(f"Index {index_config.get('index_name')}: Invalid mapping configuration: {e}. Skipping index.")
+            return None
     
     def _process_about_file_index(self, index_config: Dict[str, Any]) -> int:
         """Process an about file index.
@@ -469,15 +768,9 @@ class Loader:
         index_name = index_config.get('index_name')
         
         # Use provided mapping (parsed) or default
-        mapping_config = index_config.get('mapping')
-        if mapping_config:
-            try:
-                mapping = self._parse_mapping(mapping_config)
-            except ValueError as e:
-                logger.error(f"Index {index_name}: Invalid mapping configuration: {e}. Skipping index.")
-                return 0
-        else:
-            mapping = self._get_default_about_mapping()
+        mapping = self._mapping_or_default(index_config, DEFAULT_ABOUT_MAPPING)
+        if mapping is None:
+            return 0
         
         about_file = self.config.get_about_file()
         
@@ -508,68 +801,151 @@ class Loader:
             return 0
         
         # Use provided mapping (parsed) or auto-generate based on subtype
-        mapping_config = index_config.get('mapping')
-        if mapping_config:
-            try:
-                mapping = self._parse_mapping(mapping_config)
-            except ValueError as e:
-                logger.error(f"Index {index_name}: Invalid mapping configuration: {e}. Skipping index.")
-                return 0
-        else:
-            mapping = self._get_default_model_mapping(subtype)
+        mapping = self._mapping_or_default(index_config, DEFAULT_MODEL_MAPPINGS.get(subtype, {}))
+        if mapping is None:
+            return 0
         
         return self.load_model(index_name, mapping, subtype)
     
-    def _process_query_index(self, index_config: Dict[str, Any]) -> int:
+    def _process_query_index(self, plan: IndexPlan) -> int:
         """Process a query-based index (default behavior).
         
         Args:
-            index_config: Index configuration dictionary
+            plan: Validated index plan
             
         Returns:
             Number of documents loaded from initial query
         """
-        index_name = index_config.get('index_name')
-        id_field = index_config.get('id_field')
-        if not id_field:
-            raise ValueError("id_field is required in index configuration")
+        index_name = plan.index_name
+        if self.opts.alias_swap:
+            return self._process_query_index_via_alias(plan)
         
-        # REQUIRE mapping - skip index if missing
-        mapping_config = index_config.get('mapping')
-        if not mapping_config:
-            logger.error(f"Index {index_name} is missing required 'mapping' configuration. Skipping index.")
-            return 0
+        # Create index with explicit mapping BEFORE processing any documents
+        # This prevents OpenSearch from auto-creating the index with dynamic mapping
+        # Use force=True to ensure we recreate the index even if it exists (in case it was auto-created)
+        created = self._prepare_index(index_name, plan.mapping, force=True, dynamic=self._query_index_dynamic)
         
-        # Parse the mapping
+        # Disable refresh and replicas while loading; restored once all queries have run
+        saved_settings = self._tune_index_for_bulk(index_name) if self.opts.tune_for_bulk else None
         try:
-            parsed_mapping = self._parse_mapping(mapping_config)
-        except ValueError as e:
-            logger.error(f"Index {index_name}: Invalid mapping configuration: {e}. Skipping index.")
-            return 0
+            # With refresh disabled, a single refresh happens when settings are restored
+            return self._load_query_index(plan, refresh=saved_settings is None,
+                                          strict_index=created and self.opts.strict_mapping)
+        finally:
+            if saved_settings is not None:
+                self._restore_index_settings(index_name, saved_settings)
+    
+    def _process_query_index_via_alias(self, plan: IndexPlan) -> int:
+        """Load a query-based index into a new index, then swap the alias to it.
+        
+        The index name keeps serving the previous data until the new index is
+        complete. If loading fails, the new index is deleted and the alias is left
+        unchanged.
+        
+        Args:
+            plan: Validated index plan
+            
+        Returns:
+            Number of documents loaded from initial query
+        """
+        index_name = plan.index_name
+        physical = f"{index_name}-{self._index_suffix}"
+        # Never recreate an existing index: it may be the one the alias is serving
+        if self.opensearch.index_exists(physical):
+            raise ValueError(f"Index {physical} already exists; leaving it and the alias {index_name} unchanged")
+        logger.info(f"Creating index {physical} for alias {index_name}")
+        created = self.opensearch.create_index(physical, mapping=plan.mapping, dynamic=self._query_index_dynamic)
         
-        # Delete index if configured
-        if self.config.get_clear_existing_indices():
+        try:
+            saved_settings = self._tune_index_for_bulk(physical) if self.opts.tune_for_bulk else None
+            try:
+                total_documents = self._load_query_index(plan, refresh=saved_settings is None,
+                                                         write_index=physical,
+                                                         strict_index=created and self.opts.strict_mapping)
+            finally:
+                if saved_settings is not None:
+                    self._restore_index_settings(physical, saved_settings)
+        except BaseException:
+            logger.error(f"Index {index_name}: Load into {physical} failed, deleting it and leaving the alias unchanged")
+            self.opensearch.delete_index(physical)
+            raise
+        
+        self.opensearch.swap_alias(index_name, physical)
+        return total_documents
+    
+    @property
+    def _query_index_dynamic(self) -> Union[bool, str]:
+        """Dynamic mapping setting for query indices (see strict_mapping)."""
+        return 'strict' if self.opts.strict_mapping else False
+    
+    def _prepare_index(self, index_name: str, mapping: Dict[str, Any], force: bool = False,
+                       dynamic: Union[bool, str] = False) -> bool:
+        """Delete and/or create an index as configured by clear_existing_indices and allow_index_creation.
+        
+        Args:
+            index_name: Name of the index
+            mapping: Parsed OpenSearch mapping for the index
+            force: Passed to create_index; recreate the index even if it exists
+            dynamic: Passed to create_index; dynamic mapping setting for the index
+            
+        Returns:
+            True if the index was created here, False if an existing index is used as is
+        """
+        if self.opts.clear_existing:
             logger.info(f"Deleting index (if exists): {index_name}")
             self.opensearch.delete_index(index_name)
         
-        # Create index with explicit mapping BEFORE processing any documents
-        # This prevents OpenSearch from auto-creating the index with dynamic mapping
-        # Use force=True to ensure we recreate the index even if it exists (in case it was auto-created)
-        if self.config.get_allow_index_creation():
+        if self.opts.allow_create:
             logger.info(f"Creating index (if not exists): {index_name} with explicit mapping")
-            self.opensearch.create_index(index_name, mapping=parsed_mapping, force=True)
-        
-        # Execute initial query
-        initial_query_config = index_config.get('initial_query')
-        if not initial_query_config:
-            raise ValueError(f"initial_query is required for index {index_name}")
+            return self.opensearch.create_index(index_name, mapping=mapping, force=force, dynamic=dynamic)
+        return False
+    
+    def _tune_index_for_bulk(self, index_name: str) -> Optional[Dict[str, Any]]:
+        """Apply BULK_LOAD_SETTINGS to an index, returning its previous values.
         
-        query = initial_query_config.get('query')
-        if not query:
-            raise ValueError(f"initial_query.query is required for index {index_name}")
+        Failures are logged and not fatal; None is returned so nothing is restored.
+        """
+        try:
+            saved = self.opensearch.get_index_settings(index_name, *BULK_LOAD_SETTINGS)
+            self.opensearch.set_index_settings(index_name, BULK_LOAD_SETTINGS)
+        except Exception as e:
+            logger.warning(f"Index {index_name}: Could not apply bulk load settings: {e}")
+            return None
+        logger.debug(f"Index {index_name}: Applied bulk load settings {BULK_LOAD_SETTINGS}")
+        return saved
+    
+    def _restore_index_settings(self, index_name: str, saved: Dict[str, Any]):
+        """Restore settings saved by _tune_index_for_bulk and refresh the index."""
+        try:
+            self.opensearch.set_index_settings(index_name, saved)
+            self.opensearch.refresh_index(index_name)
+        except Exception as e:
+            logger.warning(f"Index {index_name}: Could not restore index settings {saved}: {e}")
+    
+    def _load_query_index(self, plan: IndexPlan, refresh: bool = True,
+                          write_index: Optional[str] = None, strict_index: bool = False) -> int:
+        """Run the initial query and update queries for a query-based index.
         
-        variables = initial_query_config.get('variables', {})
-        page_size = initial_query_config.get('page_size', 10000)  # Default to 10000
+        Args:
+            plan: Validated index plan
+            refresh: Whether to refresh the index after the initial query and after
+                the update queries. Bulk updates use realtime gets, so they do not
+                depend on the initial load having been refreshed.
+            write_index: Index to write to, if not plan.index_name (see alias_swap)
+            strict_index: Whether this run created the target index with strict dynamic
+                mapping, so OpenSearch rejects unmapped fields and validation is skipped
+            
+        Returns:
+            Number of documents loaded from initial query
+            
+        Raises:
+            ValueError: If write_index is given and a query returns unmapped fields.
+                Without write_index, the index is left as loaded so far instead.
+        """
+        index_name = plan.index_name
+        target = write_index or index_name
+        id_field = plan.id_field
+        query = plan.initial_query
         
         query_name = "Initial Query"
         logger.info(f"{index_name}:{query_name}: Starting initial query")
@@ -578,86 +954,202 @@ class Loader:
         query_key = f"{index_name}:{query_name}"
         
         total_documents = 0
-        page_num = 0
-        first_page_validated = False
+        # A strict index created by this run rejects unmapped fields itself
+        first_page_validated = strict_index
+        bulk = BulkSubmitter(self._bulk_executor, self.opts.bulk_workers)
+        progress = RunningTotal()
+        sizer = None
+        if self.opts.adaptive_bulk_size:
+            sizer = AdaptiveBulkSize(self.opts.target_bulk_docs, self.opts.bulk_latency_target)
+        
+        # Fetch the next page from Memgraph in the background while the current one is bulk upserted
+        # Note: Initial queries always run completely (test_mode=False), even in test mode.
+        # Only update queries are limited to one page in test mode.
+        timer = QueryTimer(self.memgraph.execute_paginated_query(
+            query, parameters=plan.initial_vars, page_size=plan.initial_page_size,
+            index_name=index_name, query_name=query_name,
+            test_mode=False, cursor_field=plan.initial_cursor_field
+        ))
+        pages = prefetch(timer, self.opts.prefetch_pages)
+        submit = bulk.submit
+        upsert_page = self._upsert_page
         
         try:
             # Process pages incrementally
-            # Note: Query execution time is tracked inside execute_paginated_query
-            # and will be available in self.memgraph.last_query_time after the loop
-            # Note: Initial queries always run completely (test_mode=False), even in test mode.
-            # Only update queries are limited to one page in test mode.
-            for page_documents in self.memgraph.execute_paginated_query(
-                query, parameters=variables, page_size=page_size,
-                index_name=index_name, query_name=query_name,
-                test_mode=False
+            # Note: Memgraph query time per page is summed by the timer
+            # Consecutive small pages are merged so each bulk upsert carries a worthwhile payload
+            for page_label, page_documents in coalesce_pages(
+                pages, self.opts.target_bulk_docs, self.opts.target_bulk_bytes, sizer
             ):
-                page_num += 1
-                
-                if not page_documents:
-                    continue
-                
-                # Validate fields on first page only
+                # Validate fields on first batch only
                 if not first_page_validated:
-                    if not self._validate_query_fields(index_name, page_documents, parsed_mapping):
+                    if not self._validate_query_fields(index_name, page_documents, plan.mapped_fields):
                         # Validation failed - error already logged, skip entire index
+                        if write_index is not None:
+                            # Fail the load so the alias is not pointed at an empty index
+                            raise ValueError("Initial query returned unmapped fields")
                         return 0
                     first_page_validated = True
                 
-                # Process this page with retry logic
-                try:
-                    logger.info(f"{index_name}:{query_name}: Loading page {page_num} to OpenSearch: {len(page_documents)} documents")
-                    self.opensearch.bulk_upsert(index_name, page_documents, id_field, query_name=query_name)
-                    total_documents += len(page_documents)
-                    logger.info(f"{index_name}:{query_name}: Completed loading page {page_num} to OpenSearch: {len(page_documents)} documents (total: {total_documents})")
-                except Exception as e:
-                    # Retry once
-                    logger.warning(f"Error processing page {page_num} for {index_name}, retrying: {e}")
-                    try:
-                        logger.info(f"{index_name}:{query_name}: Retrying loading page {page_num} to OpenSearch: {len(page_documents)} documents")
-                        self.opensearch.bulk_upsert(index_name, page_documents, id_field, query_name=query_name)
-                        total_documents += len(page_documents)
-                        logger.info(f"{index_name}:{query_name}: Retry successful for page {page_num}: {len(page_documents)} documents (total: {total_documents})")
-                    except Exception as retry_error:
-                        truncated_query = self._truncate_query(query)
-                        logger.error(f"Retry failed for page {page_num} for {index_name}: {retry_error}. Query: {truncated_query}. Skipping entire index.")
-                        raise
+                # Hand the batch to the bulk executor; waits only if bulk_workers requests are in flight
+                submit(upsert_page, target, id_field, query_name, query, page_label,
+                       page_documents, progress, sizer)
+            
+            # Wait for outstanding pages; the first failure (after its retry) fails the index
+            total_documents = bulk.drain()
             
             if total_documents == 0:
                 logger.warning(f"No documents returned from initial query for {index_name}")
                 # Index was already created before processing pages, so no need to create again
             else:
                 logger.info(f"{index_name}:{query_name}: Completed initial query: {total_documents} total documents processed")
+                if sizer is not None:
+                    logger.info(f"{index_name}:{query_name}: Adaptive bulk size settled at {sizer.size} documents "
+                                f"(set target_bulk_docs to pin it)")
         except ValueError as e:
             truncated_query = self._truncate_query(query)
             logger.error(f"Error executing initial query for {index_name}: {e}. Query: {truncated_query}. Skipping to next query.")
             raise
         finally:
+            # Stop the background fetch and abandon outstanding pages (no-op after a clean drain)
+            pages.close()
+            bulk.cancel()
+            
             # Record query execution time (only Memgraph query time, not OpenSearch operations)
-            # This is set after the generator is exhausted
-            query_duration = self.memgraph.last_query_time
-            if query_duration > 0:
-                self.query_timings[query_key].append(query_duration)
+            # The producer thread has been joined, so the timer total is final
+            if timer.total > 0:
+                self._record_query_time(query_key, timer.total)
         
-        # Refresh index after all initial upsert operations complete
-        self.opensearch.refresh_index(index_name)
+        # Refresh index after all initial upsert operations complete (if any documents were written)
+        if refresh and total_documents:
+            self.opensearch.refresh_index(target)
         
         # Execute update queries
-        update_queries = index_config.get('update_queries', [])
-        for update_query_config in update_queries:
+        total_updates = 0
+        for update_plan in plan.update_plans:
             try:
-                self._process_update_query(index_name, id_field, update_query_config, parsed_mapping)
+                total_updates += self._process_update_query(index_name, id_field, update_plan, plan.mapped_fields,
+                                                            write_index=target, strict_index=strict_index)
             except ValueError:
                 # Validation failed in update query - skip entire index
                 logger.error(f"Index {index_name}: Skipping remaining update queries due to validation failure.")
+                if write_index is not None:
+                    # Fail the load so the alias is not pointed at a partially updated index
+                    raise
                 break
         
-        # Refresh index after all update queries complete
-        if update_queries:
-            self.opensearch.refresh_index(index_name)
+        # Refresh index after all update queries complete (if any updates were sent)
+        if refresh and total_updates:
+            self.opensearch.refresh_index(target)
         
         return total_documents
     
+    def _retry_bulk(self, op: Callable[..., Any], *args, attempts: Optional[int] = None,
+                    base: float = BULK_RETRY_BASE_DELAY, **kwargs) -> Any:
+        """Call a bulk operation, retrying transient OpenSearch errors with exponential backoff.
+        
+        Throttling/unavailable responses (see RETRYABLE_STATUS_CODES), connection errors
+        and bulk requests whose failed items were all rejected with 429 are retried after
+        base * 2**attempt seconds plus up to base seconds of jitter. Any other error
+        (e.g. a 400 mapping error) is raised immediately.
+        
+        Args:
+            op: Bulk operation to call with *args and **kwargs
+            attempts: Maximum number of attempts (default: bulk_retry_attempts setting)
+            base: Base backoff delay in seconds (default: BULK_RETRY_BASE_DELAY)
+            
+        Returns:
+            Result of op
+        """
+        attempts = attempts or self.opts.bulk_retry_attempts
+        for attempt in range(attempts):
+            try:
+                return op(*args, **kwargs)
+            except (TransportError, BulkIndexError) as e:
+                if not _is_retryable(e) or attempt == attempts - 1:
+                    raise
+                delay = base * 2 ** attempt + random.uniform(0, base)
+                logger.warning("Bulk request failed with retryable error (attempt %d/%d), retrying in %.1fs: %s",
+                               attempt + 1, attempts, delay, e)
+                time.sleep(delay)
+    
+    def _upsert_page(self, index_name: str, id_field: str, query_name: str, query: str,
+                     page_num: str, page_documents: List[Dict[str, Any]], progress: RunningTotal,
+                     sizer: Optional[AdaptiveBulkSize] = None) -> int:
+        """Bulk upsert one batch of initial query results, retrying transient errors.
+        
+        Runs on the bulk executor. page_num labels the page(s) in the batch, e.g. "3" or "3-5".
+        Logs one INFO line per batch with its duration and the query's running total.
+        If sizer is given, it is told how long the request took (including retries).
+        
+        Returns:
+            Number of documents in the page
+        """
+        count = len(page_documents)
+        logger.debug("%s:%s: Loading page %s to OpenSearch: %d documents", index_name, query_name, page_num, count)
+        start = time.perf_counter()
+        try:
+            self._retry_bulk(self.opensearch.bulk_upsert, index_name, page_documents, id_field, query_name=query_name)
+        except Exception as e:
+            if sizer is not None:
+                sizer.record(None)
+            reason = _strict_mapping_reason(e)
+            if reason:
+                logger.error(f"Index {index_name}: Query returned a field not found in mapping: {reason}")
+            truncated_query = self._truncate_query(query)
+            logger.error(f"Failed to load page {page_num} for {index_name}: {e}. Query: {truncated_query}. Skipping entire index.")
+            raise
+        elapsed = time.perf_counter() - start
+        if sizer is not None:
+            sizer.record(elapsed)
+        logger.info("%s:%s: Loaded page %s to OpenSearch: %d documents in %d ms (%d total)", index_name, query_name,
+                    page_num, count, elapsed * 1000, progress.add(count))
+        return count
+    
+    def _update_page(self, index_name: str, id_field: str, query_name: str, query: str,
+                     page_num: str, page_updates: List[Dict[str, Any]], progress: RunningTotal,
+                     sizer: Optional[AdaptiveBulkSize] = None) -> int:
+        """Bulk update one batch of update query results, retrying transient errors.
+        
+        Runs on the bulk executor. page_num labels the page(s) in the batch, e.g. "3" or "3-5".
+        Logs one INFO line per batch with its duration and the query's running total.
+        When OpenSearch rejects some updates with 429, only those are resent on retry.
+        If sizer is given, it is told how long the request took (including retries).
+        
+        Returns:
+            Number of updates in the batch
+        """
+        count = len(page_updates)
+        logger.debug("%s:%s: Loading page %s to OpenSearch: %d updates", index_name, query_name, page_num, count)
+        start = time.perf_counter()
+        pending = page_updates
+        
+        def update_pending():
+            nonlocal pending
+            try:
+                self.opensearch.bulk_update(index_name, pending, id_field, query_name=query_name)
+            except BulkIndexError as e:
+                # Every other update was applied; narrow the next attempt to the rejected ones
+                rejected_ids = {next(iter(item.values()), {}).get('_id') for item in e.errors}
+                if None not in rejected_ids:
+                    pending = [update for update in pending if str(update.get(id_field)) in rejected_ids]
+                raise
+        
+        try:
+            self._retry_bulk(update_pending)
+        except Exception as e:
+            if sizer is not None:
+                sizer.record(None)
+            truncated_query = self._truncate_query(query)
+            logger.error(f"Failed to load page {page_num} for update query '{query_name}' in {index_name}: {e}. Query: {truncated_query}. Skipping entire index.")
+            raise
+        elapsed = time.perf_counter() - start
+        if sizer is not None:
+            sizer.record(elapsed)
+        logger.info("%s:%s: Loaded page %s to OpenSearch: %d updates in %d ms (%d total)", index_name, query_name,
+                    page_num, count, elapsed * 1000, progress.add(count))
+        return count
+    
     def load_about_page(self, index_name: str, mapping: Dict[str, Any], file_name: str) -> int:
         """Load about page content from YAML file.
         
@@ -674,38 +1166,32 @@ class Loader:
             raise ValueError(f'"{file_name}" is not a file!')
         
         # Delete and recreate index with mapping
-        if self.config.get_clear_existing_indices():
-            logger.info(f"Deleting index (if exists): {index_name}")
-            self.opensearch.delete_index(index_name)
+        self._prepare_index(index_name, mapping)
         
-        if self.config.get_allow_index_creation():
-            logger.info(f"Creating index (if not exists): {index_name}")
-            self.opensearch.create_index(index_name, mapping=mapping)
-        
-        # Load and index pages
-        page_count = 0
-        with open(file_name) as file_obj:
-            about_file = yaml.safe_load(file_obj)
-            if not about_file:
-                logger.warning(f"About file {file_name} is empty")
-                return 0
-            
-            for page in about_file:
-                page_num = page.get('page')
-                if page_num is None:
-                    logger.warning(f"Skipping page without 'page' field: {page}")
-                    continue
-                
-                logger.info(f'Indexing about page "{page_num}"')
-                doc_id = f'page{page_num}'
-                self.opensearch.upsert_document(index_name, doc_id, page)
-                page_count += 1
+        # Stream pages from the file into bulk requests, with IDs "page<page>".
+        # Each attempt re-reads the file, so a retry resends every page.
+        page_count = self._retry_bulk(
+            lambda: self.opensearch.bulk_upsert(index_name, self._iter_about_pages(file_name), 'page',
+                                                id_prefix='page')
+        )
+        if not page_count:
+            logger.warning(f"About file {file_name} has no pages")
+            return 0
+        logger.info(f"Indexed {page_count} about pages")
         
         # Refresh index
         self.opensearch.refresh_index(index_name)
         
         return page_count
     
+    def _iter_about_pages(self, file_name: str) -> Iterator[Dict[str, Any]]:
+        """Yield the pages of an about file as they are parsed, skipping any without a 'page' field."""
+        for page in iter_yaml_sequence(file_name):
+            if page.get('page') is None:
+                logger.warning("Skipping page without 'page' field: %s", page)
+                continue
+            yield page
+    
     def read_model(self, model_files: List[str]):
         """Read and initialize model from files.
         
@@ -723,8 +1209,27 @@ class Loader:
         # Initialize model with default type mapping
         props = Props()
         self.model = Schema(model_files, props)
+        self._model_props = None
         logger.info("Model loaded successfully")
     
+    def _model_properties(self) -> Dict[str, List[Tuple[str, Dict[str, Any]]]]:
+        """Get each model node's properties, excluding relationship-based ones.
+        
+        Built once per model and shared by the property and value subtypes.
+        
+        Returns:
+            Dictionary mapping node names to lists of (property name, property) tuples
+        """
+        if self._model_props is None:
+            from .schema import PROPERTIES, PROP_TYPE
+            
+            self._model_props = {
+                node_name: [(prop_name, prop) for prop_name, prop in obj.get(PROPERTIES, {}).items()
+                            if "@relation" not in prop.get(PROP_TYPE, '')]
+                for node_name, obj in self.model.nodes.items()
+            }
+        return self._model_props
+    
     def get_model_data(self, subtype: str):
         """Generate model data documents for indexing.
         
@@ -734,17 +1239,13 @@ class Loader:
         Yields:
             Dictionary documents for indexing
         """
-        from .schema import PROPERTIES, PROP_TYPE, DESCRIPTION, REQUIRED, ENUM, PROP_ENUM
+        from .schema import PROP_TYPE, DESCRIPTION, REQUIRED, ENUM, PROP_ENUM
         
         if not self.model:
             return
         
-        nodes = self.model.nodes
-        for node_name, obj in nodes.items():
-            # Safely get properties, defaulting to empty dict if PROPERTIES key doesn't exist
-            props = obj.get(PROPERTIES, {})
-            
-            if subtype == 'node':
+        if subtype == 'node':
+            for node_name in self.model.nodes:
                 yield {
                     'id': node_name,
                     'type': 'node',
@@ -752,40 +1253,42 @@ class Loader:
                     'node_name': node_name,
                     'node_kw': node_name
                 }
-            else:
-                for prop_name, prop in props.items():
-                    # Skip relationship based properties
-                    if "@relation" in prop.get(PROP_TYPE, ''):
-                        continue
-                    
-                    if subtype == 'property':
-                        yield {
-                            'id': f"{node_name}_{prop_name}",
-                            'type': 'property',
-                            'node': node_name,
-                            'node_name': node_name,
-                            'property': prop_name,
-                            'property_name': prop_name,
-                            'property_kw': prop_name,
-                            'property_description': prop.get(DESCRIPTION, ''),
-                            'property_required': prop.get(REQUIRED, False),
-                            'property_type': PROP_ENUM if ENUM in prop else prop.get(PROP_TYPE, 'String')
-                        }
-                    elif subtype == 'value' and ENUM in prop:
-                        for value in prop[ENUM]:
-                            yield {
-                                'id': f"{node_name}_{prop_name}_{value}",
-                                'type': 'value',
-                                'node': node_name,
-                                'node_name': node_name,
-                                'property': prop_name,
-                                'property_name': prop_name,
-                                'property_description': prop.get(DESCRIPTION, ''),
-                                'property_required': prop.get(REQUIRED, False),
-                                'property_type': PROP_ENUM,
-                                'value': value,
-                                'value_kw': value
-                            }
+            return
+        
+        for node_name, props in self._model_properties().items():
+            for prop_name, prop in props:
+                if subtype == 'property':
+                    yield {
+                        'id': f"{node_name}_{prop_name}",
+                        'type': 'property',
+                        'node': node_name,
+                        'node_name': node_name,
+                        'property': prop_name,
+                        'property_name': prop_name,
+                        'property_kw': prop_name,
+                        'property_description': prop.get(DESCRIPTION, ''),
+                        'property_required': prop.get(REQUIRED, False),
+                        'property_type': PROP_ENUM if ENUM in prop else prop.get(PROP_TYPE, 'String')
+                    }
+                elif subtype == 'value' and ENUM in prop:
+                    # Fields shared by every value of this property, copied per value
+                    template = {
+                        'type': 'value',
+                        'node': node_name,
+                        'node_name': node_name,
+                        'property': prop_name,
+                        'property_name': prop_name,
+                        'property_description': prop.get(DESCRIPTION, ''),
+                        'property_required': prop.get(REQUIRED, False),
+                        'property_type': PROP_ENUM
+                    }
+                    id_prefix = f"{node_name}_{prop_name}_"
+                    for value in prop[ENUM]:
+                        doc = template.copy()
+                        doc['id'] = id_prefix + str(value)
+                        doc['value'] = value
+                        doc['value_kw'] = value
+                        yield doc
     
     def load_model(self, index_name: str, mapping: Dict[str, Any], subtype: str) -> int:
         """Load model data into index.
@@ -804,144 +1307,131 @@ class Loader:
             return 0
         
         # Delete and recreate index with mapping
-        if self.config.get_clear_existing_indices():
-            logger.info(f"Deleting index (if exists): {index_name}")
-            self.opensearch.delete_index(index_name)
-        
-        if self.config.get_allow_index_creation():
-            logger.info(f"Creating index (if not exists): {index_name}")
-            self.opensearch.create_index(index_name, mapping=mapping)
+        self._prepare_index(index_name, mapping)
         
-        # Collect all documents for bulk loading
-        documents = list(self.get_model_data(subtype))
+        # Send target_bulk_docs sized chunks as concurrent bulk requests. Chunks are cut
+        # from the generator as it runs, so the first request starts right away.
+        documents = self.get_model_data(subtype)
+        query_name = f"Model-{subtype}"
+        chunk_size = self.opts.target_bulk_docs
+        total_documents = 0
+        bulk = BulkSubmitter(self._bulk_executor, self.opts.bulk_workers)
+        try:
+            while True:
+                chunk = list(islice(documents, chunk_size))
+                if not chunk:
+                    break
+                total_documents += len(chunk)
+                bulk.submit(self._retry_bulk, self.opensearch.bulk_upsert, index_name,
+                            chunk, 'id', query_name=query_name)
+            bulk.drain()
+        finally:
+            bulk.cancel()
         
-        if documents:
-            logger.info(f"Loading {len(documents)} model documents into {index_name}")
-            self.opensearch.bulk_upsert(index_name, documents, id_field='id', query_name=f"Model-{subtype}")
-            logger.info(f"Completed loading model data into {index_name}")
+        if total_documents:
+            logger.info(f"Completed loading {total_documents} model documents into {index_name}")
         else:
             logger.warning(f"No model data generated for subtype {subtype}")
+            return 0
         
         # Refresh index
         self.opensearch.refresh_index(index_name)
         
-        return len(documents)
+        return total_documents
     
     def _process_update_query(self, index_name: str, id_field: str,
-                             update_query_config: Dict[str, Any], mapping: Dict[str, Dict[str, Any]]):
+                             update_plan: UpdatePlan, mapped_fields: FrozenSet[str],
+                             write_index: Optional[str] = None, strict_index: bool = False) -> int:
         """Process an update query.
         
         Args:
             index_name: Name of the OpenSearch index
             id_field: Field name to use as document ID
-            update_query_config: Update query configuration
-            mapping: Parsed mapping dictionary for field validation
+            update_plan: Validated update query
+            mapped_fields: Mapped field names for field validation
+            write_index: Index to write to, if not index_name (see alias_swap)
+            strict_index: Whether validation is left to the index's strict dynamic mapping
+            
+        Returns:
+            Number of updates sent to OpenSearch
         """
-        query_name = update_query_config.get('name')
-        query = update_query_config.get('query')
-        if not query:
-            query_display = query_name if query_name else 'unnamed'
-            logger.warning(f"Update query '{query_display}' missing query, skipping")
-            return
-        
-        # Warn if query name is missing
-        if not query_name:
-            logger.warning(f"{index_name}: Update query missing name, proceeding without query name prefix")
-            query_name = "unnamed"
-        
-        variables = update_query_config.get('variables', {})
-        page_size = update_query_config.get('page_size', 10000)  # Default to 10000
+        query_name = update_plan.name
+        query = update_plan.query
         
-        if query_name:
-            logger.info(f"{index_name}:{query_name}: Starting update query")
-        else:
-            logger.info(f"{index_name}: Starting update query")
+        # Log prefix, e.g. "users:update_emails" or just "users" for an unnamed query
+        prefix = f"{index_name}:{query_name}" if query_name else index_name
+        logger.info("%s: Starting update query", prefix)
         
         # Track query execution time (will be set after generator is exhausted)
         query_key = f"{index_name}:{query_name}"
         
         total_updates = 0
-        page_num = 0
-        first_page_validated = False
+        # A strict index created by this run rejects unmapped fields itself
+        first_page_validated = strict_index
+        bulk = BulkSubmitter(self._bulk_executor, self.opts.bulk_workers)
+        progress = RunningTotal()
+        sizer = None
+        if self.opts.adaptive_bulk_size:
+            sizer = AdaptiveBulkSize(self.opts.target_bulk_docs, self.opts.bulk_latency_target)
         
         # Get test_mode setting
-        test_mode = self.config.get_test_mode()
+        test_mode = self.opts.test_mode
+        target = write_index or index_name
+        
+        # Fetch the next page from Memgraph in the background while the current one is bulk updated
+        timer = QueryTimer(self.memgraph.execute_paginated_query(
+            query, parameters=update_plan.variables, page_size=update_plan.page_size,
+            index_name=index_name, query_name=query_name,
+            test_mode=test_mode, cursor_field=update_plan.cursor_field
+        ))
+        pages = prefetch(timer, self.opts.prefetch_pages)
+        submit = bulk.submit
+        update_page = self._update_page
         
         try:
             # Process pages incrementally
-            # Note: Query execution time is tracked inside execute_paginated_query
-            # and will be available in self.memgraph.last_query_time after the loop
-            for page_updates in self.memgraph.execute_paginated_query(
-                query, parameters=variables, page_size=page_size,
-                index_name=index_name, query_name=query_name,
-                test_mode=test_mode
+            # Note: Memgraph query time per page is summed by the timer
+            # Pages are regrouped like initial query pages, so a large page is spread across bulk workers
+            for page_label, page_updates in coalesce_pages(
+                pages, self.opts.target_bulk_docs, self.opts.target_bulk_bytes, sizer
             ):
-                page_num += 1
-                
-                if not page_updates:
-                    continue
-                
                 # Validate fields on first page
                 if not first_page_validated:
-                    if not self._validate_query_fields(index_name, page_updates, mapping):
+                    if not self._validate_query_fields(index_name, page_updates, mapped_fields):
                         # Validation failed - error already logged, raise to skip entire index
                         raise ValueError(f"Update query '{query_name}' returned unmapped fields. Skipping entire index.")
                     first_page_validated = True
                 
-                # Process this page with retry logic
-                try:
-                    if query_name:
-                        logger.info(f"{index_name}:{query_name}: Loading page {page_num} to OpenSearch: {len(page_updates)} updates")
-                    else:
-                        logger.info(f"{index_name}: Loading page {page_num} to OpenSearch: {len(page_updates)} updates")
-                    self.opensearch.bulk_update(index_name, page_updates, id_field, query_name=query_name)
-                    total_updates += len(page_updates)
-                    if query_name:
-                        logger.info(f"{index_name}:{query_name}: Completed loading page {page_num} to OpenSearch: {len(page_updates)} updates (total: {total_updates})")
-                    else:
-                        logger.info(f"{index_name}: Completed loading page {page_num} to OpenSearch: {len(page_updates)} updates (total: {total_updates})")
-                except Exception as e:
-                    # Retry once
-                    query_display = query_name if query_name else 'unnamed'
-                    logger.warning(f"Error processing page {page_num} for update query '{query_display}' in {index_name}, retrying: {e}")
-                    try:
-                        if query_name:
-                            logger.info(f"{index_name}:{query_name}: Retrying loading page {page_num} to OpenSearch: {len(page_updates)} updates")
-                        else:
-                            logger.info(f"{index_name}: Retrying loading page {page_num} to OpenSearch: {len(page_updates)} updates")
-                        self.opensearch.bulk_update(index_name, page_updates, id_field, query_name=query_name)
-                        total_updates += len(page_updates)
-                        if query_name:
-                            logger.info(f"{index_name}:{query_name}: Retry successful for page {page_num}: {len(page_updates)} updates (total: {total_updates})")
-                        else:
-                            logger.info(f"{index_name}: Retry successful for page {page_num}: {len(page_updates)} updates (total: {total_updates})")
-                    except Exception as retry_error:
-                        query_display = query_name if query_name else 'unnamed'
-                        truncated_query = self._truncate_query(query)
-                        logger.error(f"Retry failed for page {page_num} for update query '{query_display}' in {index_name}: {retry_error}. Query: {truncated_query}. Skipping entire index.")
-                        raise
+                # Hand the page to the bulk executor; waits only if bulk_workers requests are in flight
+                submit(update_page, target, id_field, query_name, query,
+                       page_label, page_updates, progress, sizer)
+            
+            # Wait for outstanding pages; the first failure (after its retry) fails the index
+            total_updates = bulk.drain()
             
             if total_updates == 0:
-                if query_name:
-                    logger.info(f"{index_name}:{query_name}: No updates returned from query")
-                else:
-                    logger.info(f"{index_name}: No updates returned from query")
+                logger.info("%s: No updates returned from query", prefix)
             else:
-                if query_name:
-                    logger.info(f"{index_name}:{query_name}: Completed update query: {total_updates} total updates processed")
-                else:
-                    logger.info(f"{index_name}: Completed update query: {total_updates} total updates processed")
+                logger.info("%s: Completed update query: %d total updates processed", prefix, total_updates)
+                if sizer is not None:
+                    logger.info("%s: Adaptive bulk size settled at %d documents (set target_bulk_docs to pin it)",
+                                prefix, sizer.size)
         except ValueError as e:
             query_display = query_name if query_name else 'unnamed'
             truncated_query = self._truncate_query(query)
             logger.error(f"Index {index_name}: Update query '{query_display}' returned unmapped fields. Query: {truncated_query}. Skipping entire index.")
             raise
         finally:
+            # Stop the background fetch and abandon outstanding pages (no-op after a clean drain)
+            pages.close()
+            bulk.cancel()
+            
             # Record query execution time (only Memgraph query time, not OpenSearch operations)
-            # This is set after the generator is exhausted
-            query_duration = self.memgraph.last_query_time
-            if query_duration > 0:
-                self.query_timings[query_key].append(query_duration)
+            # The producer thread has been joined, so the timer total is final
+            if timer.total > 0:
+                self._record_query_time(query_key, timer.total)
+        
+        return total_updates
     
     def _print_summary(self, total_time: float):
         """Print and save loading summary.
@@ -949,93 +1439,79 @@ class Loader:
         Args:
             total_time: Total execution time in seconds
         """
-        # Create logs directory if it doesn't exist
-        logs_dir = Path("logs")
-        logs_dir.mkdir(exist_ok=True)
-        
-        # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d-%H:%M")
-        summary_filename = logs_dir / f"{timestamp}.loading-summary"
-        
-        # Build summary text
-        lines = []
-        lines.append("=" * 80)
-        lines.append("Index Loading Summary")
-        lines.append("=" * 80)
-        lines.append("")
-        lines.append(f"{'Index Name':<40} {'Documents':<15} {'Time':<15}")
-        lines.append("-" * 80)
-        
-        for stat in self.index_stats:
-            index_name = stat['index_name']
-            doc_count = stat['document_count']
-            duration = stat['duration']
-            error = stat['error']
-            
-            # Format document count
-            if error:
-                doc_str = "ERROR"
-            else:
-                doc_str = str(doc_count)
-            
-            # Format time
-            time_str = self._format_time(duration)
-            
-            lines.append(f"{index_name:<40} {doc_str:<15} {time_str:<15}")
-        
-        lines.append("-" * 80)
-        lines.append(f"{'Total':<40} {'':<15} {self._format_time(total_time):<15}")
-        lines.append("=" * 80)
-        
-        summary_text = "\n".join(lines)
+        summary_filename = self._logs_dir / f"{self._run_timestamp}.loading-summary"
+        
+        # Build summary text: one (name, documents, time) row per index
+        rows = [
+            (stat['index_name'], "ERROR" if stat['error'] else str(stat['document_count']),
+             self._format_time(stat['duration']))
+            for stat in self.index_stats
+        ]
+        summary_text = "\n".join((
+            "=" * 80,
+            "Index Loading Summary",
+            "=" * 80,
+            "",
+            SUMMARY_ROW_FMT.format('Index Name', 'Documents', 'Time'),
+            "-" * 80,
+            *(SUMMARY_ROW_FMT.format(*row) for row in rows),
+            "-" * 80,
+            SUMMARY_ROW_FMT.format('Total', '', self._format_time(total_time)),
+            "=" * 80,
+        ))
         
         # Print to console
         logger.info("\n" + summary_text)
         
         # Save to file
         try:
-            with open(summary_filename, 'w') as f:
-                f.write(summary_text)
+            self._write_log_file(summary_filename, summary_text)
             logger.info(f"Summary saved to {summary_filename}")
         except Exception as e:
             logger.error(f"Failed to save summary to file: {e}")
     
+    def _write_log_file(self, path: Path, text: str):
+        """Atomically write a text file to the logs directory with a single write.
+        
+        The text goes to a temporary file that is then renamed over path, so a
+        reader never sees a partially written file.
+        """
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(text.encode('utf-8'))
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
     def _save_query_timings(self):
         """Save query execution timing data to file."""
         if not self.query_timings:
             return
         
-        # Create logs directory if it doesn't exist
-        logs_dir = Path("logs")
-        logs_dir.mkdir(exist_ok=True)
-        
-        # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d-%H:%M")
-        timing_filename = logs_dir / f"{timestamp}.query-timing"
+        timing_filename = self._logs_dir / f"{self._run_timestamp}.query-timing"
         
         # Build timing text
         lines = []
-        lines.append("Query Execution Times (Average)")
-        lines.append("=" * 80)
+        lines.append("Query Execution Times")
+        lines.append("=" * 110)
         lines.append("")
-        lines.append(f"{'Query':<60} {'Avg Time (s)':<20}")
-        lines.append("-" * 80)
+        lines.append(f"{'Query':<60} {'Runs':<8} {'Avg Time (s)':<14} {'Min Time (s)':<14} Max Time (s)")
+        lines.append("-" * 110)
         
         # Sort by query key for consistent output
-        for query_key in sorted(self.query_timings.keys()):
-            timings = self.query_timings[query_key]
-            if timings:
-                avg_time = sum(timings) / len(timings)
-                lines.append(f"{query_key:<60} {avg_time:.4f}")
+        for query_key, timing in sorted(self.query_timings.items()):
+            avg_time = timing.total / timing.count
+            lines.append(f"{query_key:<60} {timing.count:<8} {avg_time:<14.4f} {timing.min:<14.4f} {timing.max:.4f}")
         
-        lines.append("=" * 80)
+        lines.append("=" * 110)
         
         timing_text = "\n".join(lines)
         
         # Save to file (do not print to console)
         try:
-            with open(timing_filename, 'w') as f:
-                f.write(timing_text)
+            self._write_log_file(timing_filename, timing_text)
             logger.debug(f"Query timings saved to {timing_filename}")
         except Exception as e:
             logger.error(f"Failed to save query timings to file: {e}")
@@ -3,7 +3,7 @@
 import logging
 import re
 import time
-from typing import List, Dict, Any, Optional, Iterator
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from neo4j import GraphDatabase
 
 logger = logging.getLogger("OpenSearchLoader")
@@ -14,12 +14,24 @@ WRITE_KEYWORDS = {
     'FOREACH'
 }
 
+# $limit bound when a query is streamed in one run instead of paginated with SKIP/LIMIT
+STREAM_LIMIT = 2**62
+
+
+def _log_prefix(index_name: Optional[str], query_name: Optional[str]) -> str:
+    """Build the "index:query: " prefix used on per-page log messages."""
+    if index_name and query_name:
+        return f"{index_name}:{query_name}: "
+    return f"{index_name}: " if index_name else ""
+
 
 class MemgraphClient:
     """Client for executing read-only queries against Memgraph."""
     
     def __init__(self, host: str = "localhost", port: int = 7687,
-                 username: Optional[str] = None, password: Optional[str] = None):
+                 username: Optional[str] = None, password: Optional[str] = None,
+                 stream_queries: bool = False, max_connection_pool_size: Optional[int] = None,
+                 connection_acquisition_timeout: Optional[float] = None):
         """Initialize Memgraph client.
         
         Args:
@@ -27,11 +39,21 @@ class MemgraphClient:
             port: Memgraph port
             username: Optional username
             password: Optional password
+            stream_queries: If True, paginated queries run once and are read in
+                fetch_size batches instead of re-running with SKIP/LIMIT per page
+            max_connection_pool_size: Optional driver connection pool size (driver default if None)
+            connection_acquisition_timeout: Optional seconds to wait for a pooled connection
+                (driver default if None)
         """
         uri = f"bolt://{host}:{port}"
         auth = (username, password) if username and password else None
-        self.driver = GraphDatabase.driver(uri, auth=auth)
-        self.last_query_time = 0.0  # Track total query execution time for last paginated query
+        pool_options = {}
+        if max_connection_pool_size is not None:
+            pool_options['max_connection_pool_size'] = int(max_connection_pool_size)
+        if connection_acquisition_timeout is not None:
+            pool_options['connection_acquisition_timeout'] = float(connection_acquisition_timeout)
+        self.driver = GraphDatabase.driver(uri, auth=auth, **pool_options)
+        self.stream_queries = stream_queries
         logger.info(f"Connected to Memgraph at {uri}")
     
     def close(self):
@@ -71,22 +93,25 @@ class MemgraphClient:
         
         return True
     
-    def validate_pagination_params(self, query: str) -> bool:
-        """Validate that a query contains $skip and $limit parameters.
+    def validate_pagination_params(self, query: str, keyset: bool = False) -> bool:
+        """Validate that a query contains $skip (or $cursor) and $limit parameters.
         
         Args:
             query: Cypher query string
+            keyset: If True, the query pages with $cursor instead of $skip
             
         Returns:
-            True if query contains both $skip and $limit parameters
+            True if query contains the required parameters
             
         Raises:
-            ValueError: If query is missing $skip or $limit parameters
+            ValueError: If query is missing $skip/$cursor or $limit parameters
         """
-        has_skip = '$skip' in query or '$SKIP' in query
         has_limit = '$limit' in query or '$LIMIT' in query
         
-        if not has_skip:
+        if keyset:
+            if '$cursor' not in query and '$CURSOR' not in query:
+                raise ValueError("Query must contain $cursor parameter when cursor_field is set")
+        elif '$skip' not in query and '$SKIP' not in query:
             raise ValueError("Query must contain $skip parameter")
         
         if not has_limit:
@@ -113,86 +138,170 @@ class MemgraphClient:
         # Validate pagination parameters are present
         self.validate_pagination_params(query)
         
-        parameters = parameters or {}
-        
-        results = []
         with self.driver.session() as session:
-            result = session.run(query, parameters)
-            for record in result:
-                # Convert record to dictionary
-                results.append(dict(record))
-        
-        logger.debug(f"Executed query, returned {len(results)} results")
+            return self._run_query(session, query, parameters or {})
+    
+    def _run_query(self, session, query: str, parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run an already validated query on an open session and collect its records."""
+        # Convert records to dictionaries
+        results = [dict(record) for record in session.run(query, parameters)]
+        logger.debug("Executed query, returned %d results", len(results))
         return results
     
+    def iter_rows(self, query: str, parameters: Optional[Dict[str, Any]] = None,
+                  fetch_size: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Execute a read-only Cypher query, yielding result rows one at a time.
+        
+        Records are pulled from the server fetch_size at a time, so only one batch
+        is buffered by the driver and no result list is built.
+        
+        Args:
+            query: Cypher query string
+            parameters: Optional query parameters
+            fetch_size: Optional number of records per server fetch (driver default if None)
+            
+        Yields:
+            Result dictionaries
+        """
+        self.validate_read_only(query)
+        session_options = {'fetch_size': fetch_size} if fetch_size else {}
+        with self.driver.session(**session_options) as session:
+            for record in session.run(query, parameters or {}):
+                yield dict(record)
+    
     def execute_paginated_query(self, query: str, parameters: Optional[Dict[str, Any]] = None,
                                page_size: int = 10000, index_name: Optional[str] = None,
-                               query_name: Optional[str] = None,
-                               test_mode: bool = False) -> Iterator[List[Dict[str, Any]]]:
+                               query_name: Optional[str] = None, test_mode: bool = False,
+                               cursor_field: Optional[str] = None) -> Iterator[Tuple[List[Dict[str, Any]], float]]:
         """Execute a query with pagination, yielding pages one at a time.
         
-        Also tracks total Memgraph query execution time (excluding OpenSearch operations)
-        in self.last_query_time after the generator is exhausted.
+        Each page comes with the Memgraph query time spent producing it (excluding
+        time spent by the caller between pages). The query that finds no more
+        results is yielded as an empty page so its time is accounted for too.
+        
+        With cursor_field set, pages are fetched by keyset instead of offset: $cursor
+        is null for the first page and then the cursor_field value of the previous
+        page's last row, and $skip is always 0. The query must filter and order on
+        that field, e.g. "WHERE $cursor IS NULL OR n.id > $cursor ... ORDER BY n.id
+        LIMIT $limit", so each page costs the same regardless of its position.
         
         Args:
-            query: Cypher query string (must contain $skip and $limit parameters)
+            query: Cypher query string (must contain $skip, or $cursor with cursor_field,
+                and $limit parameters)
             parameters: Optional query parameters (will be merged with pagination params)
             page_size: Number of results per page (default: 10000)
             index_name: Optional index name for logging prefix
             query_name: Optional query name for logging prefix
             test_mode: If True, only process the first page to validate the query
+            cursor_field: Optional result column used as the keyset cursor
             
         Yields:
-            List of result dictionaries for each page
+            (page, seconds) tuples: list of result dictionaries and its query time
+            
+        Raises:
+            ValueError: If a page's last row has no cursor_field value
         """
+        if self.stream_queries:
+            yield from self._stream_query(query, parameters, page_size, index_name,
+                                          query_name, test_mode, cursor_field)
+            return
+        
+        # Validate once; every page runs the same query text
+        self.validate_read_only(query)
+        self.validate_pagination_params(query, keyset=cursor_field is not None)
+        
+        prefix = _log_prefix(index_name, query_name)
+        parameters = parameters or {}
         offset = 0
+        cursor = None
         total_results = 0
-        total_query_time = 0.0  # Track total Memgraph query execution time
         
-        # Reset last_query_time at the start to avoid stale values
-        self.last_query_time = 0.0
+        # One session (and pooled connection) serves every page of the query
+        with self.driver.session() as session:
+            while True:
+                # Merge pagination parameters with existing parameters
+                if cursor_field:
+                    merged_params = {**parameters, 'cursor': cursor, 'skip': 0, 'limit': page_size}
+                else:
+                    merged_params = {**parameters, 'skip': offset, 'limit': page_size}
+                
+                # Track time for this query execution only (not OpenSearch operations)
+                query_start = time.time()
+                page_results = self._run_query(session, query, merged_params)
+                query_time = time.time() - query_start
+                
+                if not page_results:
+                    yield page_results, query_time
+                    break
+                
+                total_results += len(page_results)
+                logger.debug("%sMemgraph query returned %d records", prefix, len(page_results))
+                yield page_results, query_time
+                
+                # In test mode, only process the first page to validate the query
+                if test_mode:
+                    logger.info("%sTest mode - stopping after first page", prefix)
+                    break
+                
+                # If we got fewer results than page_size, we're done
+                if len(page_results) < page_size:
+                    break
+                
+                offset += page_size
+                if cursor_field:
+                    cursor = page_results[-1].get(cursor_field)
+                    if cursor is None:
+                        raise ValueError(f"{prefix}Cursor field '{cursor_field}' is missing or null in query results")
         
-        while True:
-            # Merge pagination parameters with existing parameters
-            pagination_params = {'skip': offset, 'limit': page_size}
-            merged_params = {**(parameters or {}), **pagination_params}
-            
-            # Track time for this query execution only (not OpenSearch operations)
+        logger.debug("Executed paginated query, yielded %d total results across pages", total_results)
+    
+    def _stream_query(self, query: str, parameters: Optional[Dict[str, Any]],
+                      page_size: int, index_name: Optional[str], query_name: Optional[str],
+                      test_mode: bool, cursor_field: Optional[str] = None) -> Iterator[Tuple[List[Dict[str, Any]], float]]:
+        """Run a paginated query once and yield its records in batches of page_size.
+        
+        The query is executed with $skip = 0 (and a null $cursor for keyset queries)
+        and an unbounded $limit, and records are pulled from the server fetch_size at
+        a time, so the match is evaluated once instead of once per page. Yields
+        (page, seconds) like execute_paginated_query.
+        """
+        self.validate_pagination_params(query, keyset=cursor_field is not None)
+        
+        prefix = _log_prefix(index_name, query_name)
+        merged_params = {**(parameters or {}), 'skip': 0, 'limit': STREAM_LIMIT}
+        if cursor_field:
+            merged_params['cursor'] = None
+        total_results = 0
+        
+        rows = self.iter_rows(query, merged_params, fetch_size=page_size)
+        try:
             query_start = time.time()
-            page_results = self.execute_query(query, merged_params)
-            query_end = time.time()
-            total_query_time += (query_end - query_start)
-            
-            if not page_results:
-                break
+            page_results: List[Dict[str, Any]] = []
+            for row in rows:
+                page_results.append(row)
+                if len(page_results) < page_size:
+                    continue
+                # Time spent downstream while the page is consumed is not query time
+                query_time = time.time() - query_start
+                total_results += len(page_results)
+                logger.debug("%sMemgraph query returned %d records", prefix, len(page_results))
+                yield page_results, query_time
+                if test_mode:
+                    logger.info("%sTest mode - stopping after first page", prefix)
+                    return
+                page_results = []
+                query_start = time.time()
+            query_time = time.time() - query_start
             
-            total_results += len(page_results)
-            if index_name and query_name:
-                logger.info(f"{index_name}:{query_name}: Memgraph query returned {len(page_results)} records")
-            elif index_name:
-                logger.info(f"{index_name}: Memgraph query returned {len(page_results)} records")
-            else:
-                logger.info(f"Memgraph query returned {len(page_results)} records")
-            yield page_results
-            
-            # In test mode, only process the first page to validate the query
-            if test_mode:
-                if index_name and query_name:
-                    logger.info(f"{index_name}:{query_name}: Test mode - stopping after first page")
-                elif index_name:
-                    logger.info(f"{index_name}: Test mode - stopping after first page")
-                else:
-                    logger.info("Test mode - stopping after first page")
-                break
-            
-            # If we got fewer results than page_size, we're done
-            if len(page_results) < page_size:
-                break
-            
-            offset += page_size
+            # The remainder may be empty; it still carries the time spent finishing the stream
+            if page_results:
+                total_results += len(page_results)
+                logger.debug("%sMemgraph query returned %d records", prefix, len(page_results))
+            yield page_results, query_time
+            if page_results and test_mode:
+                logger.info("%sTest mode - stopping after first page", prefix)
+        finally:
+            # Release the session promptly if the consumer stops early
+            rows.close()
         
-        # Store the total query time for this paginated query
-        # This will be available after the generator is exhausted
-        self.last_query_time = total_query_time
-        logger.debug(f"Executed paginated query, yielded {total_results} total results across pages")
-
+        logger.debug("Executed streamed query, yielded %d total results across pages", total_results)
@@ -1,21 +1,104 @@
 """OpenSearch client for index management and document upsert."""
 
+import gzip
 import logging
-from typing import List, Dict, Any, Optional
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple, Union
 from opensearchpy import OpenSearch, RequestsHttpConnection
-from opensearchpy.helpers import bulk
+from opensearchpy.helpers import BulkIndexError, bulk
+from opensearchpy.serializer import JSONSerializer
 from requests_aws4auth import AWS4Auth
 from botocore.session import Session
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib json serializer
+    orjson = None
+
 logger = logging.getLogger("OpenSearchLoader")
 
+# Default HTTP connection pool size; large enough for overlapped bulk requests across indices
+DEFAULT_POOL_MAXSIZE = 25
+
+# Default request limits for bulk bodies (same as the opensearchpy helpers); see bulk_chunk_size.
+# NDJSON bodies are built per chunk rather than streamed: SigV4 signing and gzip need the whole body,
+# and a retried request must be able to resend it.
+BULK_CHUNK_DOCS = 500
+BULK_CHUNK_BYTES = 100 * 1024 * 1024
+
+# Times OpenSearch retries a partial update that hits a version conflict
+UPDATE_RETRY_ON_CONFLICT = 3
+
+# gzip level for compressed request bodies; level 1 is several times faster than the
+# library default (9) for a slightly larger body
+GZIP_LEVEL = 1
+
+# Bulk responses are trimmed to what failure handling reads: per-item id, status and error
+BULK_FILTER_PATH = "took,errors,items.*._id,items.*.status,items.*.error"
+
+
+def _log_prefix(index_name: Optional[str], query_name: Optional[str]) -> str:
+    """Build the "index:query: " prefix used on per-page log messages."""
+    if index_name and query_name:
+        return f"{index_name}:{query_name}: "
+    return f"{index_name}: " if index_name else ""
+
+
+def _has_id(doc_id: Any) -> bool:
+    """Check whether a document ID value is usable: not missing or empty (0 is a valid ID)."""
+    return doc_id is not None and doc_id != ''
+
+
+class ORJSONSerializer(JSONSerializer):
+    """JSON serializer backed by orjson, used for request bodies (including bulk actions)
+    and for parsing responses.
+    
+    Values orjson cannot encode natively go through JSONSerializer.default; anything
+    it still rejects (e.g. integers beyond 64 bits) falls back to the stdlib encoder.
+    """
+    
+    OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson else 0
+    
+    def dumps(self, data: Any) -> str:
+        # Strings are passed through unchanged, as in JSONSerializer
+        if isinstance(data, str):
+            return data
+        try:
+            return orjson.dumps(data, default=self.default, option=self.OPTIONS).decode('utf-8')
+        except orjson.JSONEncodeError:
+            return super().dumps(data)
+    
+    def loads(self, s: Any) -> Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # Let the stdlib parser accept (or report) what orjson rejects, e.g. NaN
+            return super().loads(s)
+    
+    def dumps_bytes(self, data: Any) -> bytes:
+        """Serialize data to UTF-8 encoded JSON bytes."""
+        try:
+            return orjson.dumps(data, default=self.default, option=self.OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().dumps(data).encode('utf-8')
+
+
+class FastGzipConnection(RequestsHttpConnection):
+    """RequestsHttpConnection that gzips request bodies at GZIP_LEVEL (with http_compress)."""
+    
+    def _gzip_compress(self, body: Any) -> bytes:
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
 
 class OpenSearchClient:
     """Client for managing OpenSearch indices and documents."""
     
     def __init__(self, host: str, use_ssl: bool = False,
                  verify_certs: bool = False, username: Optional[str] = None,
-                 password: Optional[str] = None):
+                 password: Optional[str] = None, pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 http_compress: bool = True, bulk_chunk_size: int = BULK_CHUNK_DOCS,
+                 bulk_max_bytes: int = BULK_CHUNK_BYTES):
         """Initialize OpenSearch client.
         
         Args:
@@ -24,6 +107,11 @@ class OpenSearchClient:
             verify_certs: Whether to verify SSL certificates
             username: Optional username for authentication
             password: Optional password for authentication
+            pool_maxsize: Maximum number of pooled HTTP connections, so concurrent
+                requests reuse connections instead of opening new TLS sessions
+            http_compress: Whether to gzip request bodies (at GZIP_LEVEL)
+            bulk_chunk_size: Maximum number of documents per bulk request body
+            bulk_max_bytes: Maximum size in bytes of a bulk request body
         """
         # Normalize host to a list for OpenSearch library
         hosts = [host]
@@ -37,6 +125,9 @@ class OpenSearchClient:
                 service='es'
             )
         
+        self.bulk_chunk_size = bulk_chunk_size
+        self.bulk_max_bytes = bulk_max_bytes
+        self.serializer = ORJSONSerializer() if orjson else JSONSerializer()
         self.client = OpenSearch(
             hosts=hosts,
             http_auth=http_auth,
@@ -44,11 +135,19 @@ class OpenSearchClient:
             use_ssl=use_ssl,
             verify_certs=verify_certs,
             ssl_show_warn=False,
-            connection_class=RequestsHttpConnection,
-            timeout=timeout_seconds
+            connection_class=FastGzipConnection,
+            timeout=timeout_seconds,
+            pool_maxsize=pool_maxsize,
+            http_compress=http_compress,
+            serializer=self.serializer
         )
         logger.info(f"Connected to OpenSearch at {host}")
     
+    def close(self):
+        """Close the pooled HTTP connections."""
+        if self.client:
+            self.client.close()
+    
     def index_exists(self, index_name: str) -> bool:
         """Check if an index exists.
         
@@ -73,7 +172,8 @@ class OpenSearchClient:
             logger.info(f"Index does not exist, skipping deletion: {index_name}")
     
     def create_index(self, index_name: str, id_field: Optional[str] = None,
-                     mapping: Optional[Dict[str, Any]] = None, force: bool = False):
+                     mapping: Optional[Dict[str, Any]] = None, force: bool = False,
+                     dynamic: Union[bool, str] = False):
         """Create an index with basic settings.
         
         Args:
@@ -81,6 +181,11 @@ class OpenSearchClient:
             id_field: Optional field name to map as keyword type (used if mapping not provided)
             mapping: Optional custom mapping dictionary (overrides id_field if provided)
             force: If True, delete existing index before creating (default: False)
+            dynamic: Dynamic mapping setting used with a custom mapping: False (default)
+                ignores unmapped fields, "strict" rejects documents containing them
+                
+        Returns:
+            True if the index was created, False if it already existed
         """
         # Force delete if requested (used when we want to ensure clean recreation)
         if force and self.index_exists(index_name):
@@ -101,10 +206,11 @@ class OpenSearchClient:
                 # Use provided custom mapping
                 # Disable dynamic mapping to prevent auto-detection of field types
                 body["mappings"] = {
-                    "dynamic": False,  # Disable dynamic mapping - only use explicit mappings
+                    "dynamic": dynamic,  # Only use explicit mappings
                     "properties": mapping
                 }
-                logger.info(f"Created index: {index_name} with custom mapping (dynamic mapping disabled)")
+                mode = "strict" if dynamic == "strict" else "disabled"
+                logger.info(f"Created index: {index_name} with custom mapping (dynamic mapping {mode})")
             elif id_field:
                 # Use id_field to create simple mapping
                 body["mappings"] = {
@@ -120,8 +226,34 @@ class OpenSearchClient:
                 logger.info(f"Created index: {index_name} (auto-detect field types)")
             
             self.client.indices.create(index=index_name, body=body)
-        else:
-            logger.warning(f"Index already exists: {index_name}. Skipping creation. Use force=True to recreate.")
+            return True
+        logger.warning(f"Index already exists: {index_name}. Skipping creation. Use force=True to recreate.")
+        return False
+    
+    def swap_alias(self, alias: str, index_name: str):
+        """Atomically point an alias at an index, then delete the indices it replaced.
+        
+        If a concrete index (not an alias) holds the alias name, it is removed in the
+        same atomic request, so the name stays queryable throughout.
+        
+        Args:
+            alias: Alias name (the logical index name)
+            index_name: Index the alias should point to
+        """
+        actions = []
+        previous = []
+        if self.client.indices.exists_alias(name=alias):
+            previous = [name for name in self.client.indices.get_alias(name=alias) if name != index_name]
+            actions.extend({"remove": {"index": name, "alias": alias}} for name in previous)
+        elif self.index_exists(alias):
+            logger.info(f"Replacing index {alias} with an alias to {index_name}")
+            actions.append({"remove_index": {"index": alias}})
+        actions.append({"add": {"index": index_name, "alias": alias}})
+        self.client.indices.update_aliases(body={"actions": actions})
+        logger.info(f"Alias {alias} now points to {index_name}")
+        
+        for name in previous:
+            self.delete_index(name)
     
     def refresh_index(self, index_name: str):
         """Refresh an index to make all operations visible.
@@ -132,6 +264,30 @@ class OpenSearchClient:
         self.client.indices.refresh(index=index_name)
         logger.debug(f"Refreshed index: {index_name}")
     
+    def get_index_settings(self, index_name: str, *names: str) -> Dict[str, Any]:
+        """Get explicitly set index-level settings.
+        
+        Args:
+            index_name: Name of the index
+            names: Setting names without the "index." prefix (e.g. "refresh_interval")
+            
+        Returns:
+            Dictionary of setting name to value; unset settings map to None
+        """
+        response = self.client.indices.get_settings(index=index_name)
+        settings = response.get(index_name, {}).get('settings', {}).get('index', {})
+        return {name: settings.get(name) for name in names}
+    
+    def set_index_settings(self, index_name: str, settings: Dict[str, Any]):
+        """Update dynamic index-level settings.
+        
+        Args:
+            index_name: Name of the index
+            settings: Setting names without the "index." prefix; None resets to the default
+        """
+        self.client.indices.put_settings(index=index_name, body={"index": settings})
+        logger.debug(f"Updated settings for index {index_name}: {settings}")
+    
     def get_document(self, index_name: str, doc_id: str) -> Optional[Dict[str, Any]]:
         """Get a document by ID.
         
@@ -186,44 +342,119 @@ class OpenSearchClient:
         # Upsert the merged document
         self.upsert_document(index_name, doc_id, merged)
     
-    def bulk_upsert(self, index_name: str, documents: List[Dict[str, Any]], id_field: str,
-                    query_name: Optional[str] = None):
+    def bulk_upsert(self, index_name: str, documents: Iterable[Dict[str, Any]], id_field: str,
+                    query_name: Optional[str] = None, id_prefix: str = "") -> int:
         """Bulk upsert documents.
         
+        Uses plain bulk index actions, which overwrite any existing document
+        without a server-side read or merge.
+        
         Args:
             index_name: Name of the index
-            documents: List of document dictionaries
+            documents: Iterable of document dictionaries
             id_field: Field name to use as document ID
             query_name: Optional query name for logging prefix
+            id_prefix: Optional prefix prepended to each document ID (e.g. "page")
+            
+        Returns:
+            Number of documents indexed
         """
-        actions = []
+        if orjson:
+            success, failed = self._bulk_index_ndjson(index_name, documents, id_field, id_prefix)
+        else:
+            # Actions are generated lazily so a page is never held twice (documents + actions)
+            success, failed = bulk(self.client, self._index_actions(index_name, documents, id_field, id_prefix),
+                                   chunk_size=self.bulk_chunk_size, max_chunk_bytes=self.bulk_max_bytes,
+                                   refresh=False, filter_path=BULK_FILTER_PATH)
+        if success or failed:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%sBulk upserted %d documents", _log_prefix(index_name, query_name), success)
+            if failed:
+                logger.warning("Failed to upsert %d documents", len(failed))
+        else:
+            logger.warning("No documents to upsert")
+        return success
+    
+    def _bulk_index_ndjson(self, index_name: str, documents: Iterable[Dict[str, Any]],
+                           id_field: str, id_prefix: str = "") -> Tuple[int, List[Dict[str, Any]]]:
+        """Index documents with NDJSON bodies encoded directly to bytes by orjson.
+        
+        Returns:
+            (number of documents indexed, list of failed items)
+            
+        Raises:
+            BulkIndexError: If any document fails to index (as helpers.bulk does)
+        """
+        success, errors = self._bulk_ndjson(index_name, self._index_lines(documents, id_field, id_prefix))
+        if errors:
+            raise BulkIndexError(f"{len(errors)} document(s) failed to index.", errors)
+        return success, errors
+    
+    def _bulk_ndjson(self, index_name: str, entries: Iterable[bytes]) -> Tuple[int, List[Dict[str, Any]]]:
+        """Send pre-encoded NDJSON entries (action line plus source line) as bulk requests.
+        
+        Skips the per-action dicts and the str round-trip of the opensearchpy bulk
+        helpers. Bodies are split at bulk_chunk_size entries or bulk_max_bytes.
+        
+        Returns:
+            (number of successful items, list of failed items)
+        """
+        success = 0
+        errors: List[Dict[str, Any]] = []
+        body = bytearray()
+        count = 0
+        
+        def send():
+            nonlocal success
+            response = self.client.bulk(body=bytes(body), index=index_name, filter_path=BULK_FILTER_PATH)
+            if not response.get('errors'):
+                success += count
+                return
+            for item in response.get('items', ()):
+                if 200 <= next(iter(item.values()), {}).get('status', 500) < 300:
+                    success += 1
+                else:
+                    errors.append(item)
+        
+        for entry in entries:
+            if count and (count >= self.bulk_chunk_size or len(body) + len(entry) > self.bulk_max_bytes):
+                send()
+                body.clear()
+                count = 0
+            body += entry
+            count += 1
+        if count:
+            send()
+        return success, errors
+    
+    def _index_lines(self, documents: Iterable[Dict[str, Any]], id_field: str,
+                     id_prefix: str = "") -> Iterator[bytes]:
+        """Yield NDJSON index entries for documents, skipping any without an ID."""
         for doc in documents:
             doc_id = doc.get(id_field)
-            if not doc_id:
-                logger.warning(f"Document missing {id_field}, skipping: {doc}")
+            if not _has_id(doc_id):
+                logger.warning("Document missing %s, skipping: %s", id_field, doc)
+                continue
+            yield b"".join((orjson.dumps({"index": {"_id": f"{id_prefix}{doc_id}"}}), b"\n",
+                            self.serializer.dumps_bytes(doc), b"\n"))
+    
+    def _index_actions(self, index_name: str, documents: Iterable[Dict[str, Any]],
+                       id_field: str, id_prefix: str = "") -> Iterator[Dict[str, Any]]:
+        """Yield bulk index actions for documents, skipping any without an ID."""
+        for doc in documents:
+            doc_id = doc.get(id_field)
+            if not _has_id(doc_id):
+                logger.warning("Document missing %s, skipping: %s", id_field, doc)
                 continue
             
             # Keep id_field in document source (stored as both _id and as a keyword field)
             # The id_field will be stored with its original name as a keyword type
-            action = {
+            yield {
+                "_op_type": "index",
                 "_index": index_name,
-                "_id": str(doc_id),
+                "_id": f"{id_prefix}{doc_id}",
                 "_source": doc
             }
-            actions.append(action)
-        
-        if actions:
-            success, failed = bulk(self.client, actions, refresh=False)
-            if index_name and query_name:
-                logger.debug(f"{index_name}:{query_name}: Bulk upserted {success} documents")
-            elif index_name:
-                logger.debug(f"{index_name}: Bulk upserted {success} documents")
-            else:
-                logger.debug(f"Bulk upserted {success} documents to {index_name}")
-            if failed:
-                logger.warning(f"Failed to upsert {len(failed)} documents")
-        else:
-            logger.warning("No documents to upsert")
     
     def bulk_update(self, index_name: str, updates: List[Dict[str, Any]], id_field: str,
                     query_name: Optional[str] = None):
@@ -236,6 +467,11 @@ class OpenSearchClient:
             updates: List of update dictionaries
             id_field: Field name to use as document ID
             query_name: Optional query name for logging prefix
+            
+        Raises:
+            BulkIndexError: If any updates were rejected with status 429 (write queue
+                full), after all batches have been sent. Its errors hold only the
+                rejected items, so a retry can resend just those updates.
         """
         if not updates:
             logger.warning("No updates to process")
@@ -248,26 +484,23 @@ class OpenSearchClient:
         total_updates = len(updates)
         num_batches = (total_updates + BATCH_SIZE - 1) // BATCH_SIZE  # Ceiling division
         
-        if index_name and query_name:
-            logger.debug(f"{index_name}:{query_name}: Processing {total_updates} updates in {num_batches} batches of {BATCH_SIZE}")
-        elif index_name:
-            logger.debug(f"{index_name}: Processing {total_updates} updates in {num_batches} batches of {BATCH_SIZE}")
-        else:
-            logger.debug(f"Processing {total_updates} updates in {num_batches} batches of {BATCH_SIZE}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        prefix = _log_prefix(index_name, query_name) if debug else ""
+        if debug:
+            logger.debug("%sProcessing %d updates in %d batches of %d", prefix, total_updates, num_batches, BATCH_SIZE)
         
+        rejected = []
         for i in range(0, total_updates, BATCH_SIZE):
             batch = updates[i:i + BATCH_SIZE]
-            batch_num = (i // BATCH_SIZE) + 1
-            if index_name and query_name:
-                logger.debug(f"{index_name}:{query_name}: Processing batch {batch_num}/{num_batches} ({len(batch)} updates)")
-            elif index_name:
-                logger.debug(f"{index_name}: Processing batch {batch_num}/{num_batches} ({len(batch)} updates)")
-            else:
-                logger.debug(f"Processing batch {batch_num}/{num_batches} ({len(batch)} updates)")
-            self._process_update_batch(index_name, batch, id_field, query_name=query_name)
+            if debug:
+                logger.debug("%sProcessing batch %d/%d (%d updates)", prefix, (i // BATCH_SIZE) + 1, num_batches, len(batch))
+            rejected.extend(self._process_update_batch(index_name, batch, id_field, query_name=query_name))
+        
+        if rejected:
+            raise BulkIndexError(f"{len(rejected)} update(s) rejected with status 429.", rejected)
     
     def _process_update_batch(self, index_name: str, updates: List[Dict[str, Any]], id_field: str,
-                             query_name: Optional[str] = None):
+                             query_name: Optional[str] = None) -> List[Dict[str, Any]]:
         """Process a single batch of update operations.
         
         Args:
@@ -275,43 +508,27 @@ class OpenSearchClient:
             updates: List of update dictionaries for this batch
             id_field: Field name to use as document ID
             query_name: Optional query name for logging prefix
-        """
-        actions = []
-        for update in updates:
-            doc_id = update.get(id_field)
-            if not doc_id:
-                logger.warning(f"Update missing {id_field}, skipping: {update}")
-                continue
-            
-            # Remove id_field from update doc (it's used as _id, not as a field to update)
-            update_doc = {k: v for k, v in update.items() if k != id_field}
-            
-            if not update_doc:
-                logger.warning(f"Update for {doc_id} has no fields to update, skipping")
-                continue
             
-            action = {
-                "_op_type": "update",
-                "_index": index_name,
-                "_id": str(doc_id),
-                "doc": update_doc,
-                "doc_as_upsert": False  # Don't create documents if they don't exist
-            }
-            actions.append(action)
-        
-        if not actions:
-            logger.warning("No valid updates to process in this batch")
-            return
-        
-        # Execute bulk update
+        Returns:
+            Failed items that were rejected with status 429 (write queue full)
+        """
+        # Execute bulk update (as NDJSON bytes when orjson is available); actions are generated
+        # lazily as the request is serialized.
+        # Item failures are returned rather than raised so missing documents can be skipped.
         try:
-            success, failed = bulk(self.client, actions, refresh=False)
-            if index_name and query_name:
-                logger.debug(f"{index_name}:{query_name}: Bulk updated {success} documents")
-            elif index_name:
-                logger.debug(f"{index_name}: Bulk updated {success} documents")
+            if orjson:
+                success, failed = self._bulk_ndjson(index_name, self._update_lines(updates, id_field))
             else:
-                logger.debug(f"Bulk updated {success} documents in {index_name}")
+                success, failed = bulk(self.client, self._update_actions(index_name, updates, id_field),
+                                       chunk_size=self.bulk_chunk_size, max_chunk_bytes=self.bulk_max_bytes,
+                                       refresh=False, raise_on_error=False, filter_path=BULK_FILTER_PATH)
+            if not success and not failed:
+                logger.warning("No valid updates to process in this batch")
+                return []
+            debug = logger.isEnabledFor(logging.DEBUG)
+            prefix = _log_prefix(index_name, query_name) if debug else ""
+            if debug:
+                logger.debug("%sBulk updated %d documents", prefix, success)
             
             if failed:
                 # Count missing documents separately
@@ -335,17 +552,57 @@ class OpenSearchClient:
                     else:
                         other_errors.append(item)
                 
-                if missing_count > 0:
-                    if index_name and query_name:
-                        logger.debug(f"{index_name}:{query_name}: Skipped {missing_count} missing documents")
-                    elif index_name:
-                        logger.debug(f"{index_name}: Skipped {missing_count} missing documents")
-                    else:
-                        logger.debug(f"Skipped {missing_count} missing documents in {index_name}")
+                if missing_count > 0 and debug:
+                    logger.debug("%sSkipped %d missing documents", prefix, missing_count)
+                
+                # Updates rejected by a full write queue are returned so they can be retried
+                rejected = [item for item in other_errors if item.get('update', {}).get('status') == 429]
+                other_errors = [item for item in other_errors if item.get('update', {}).get('status') != 429]
                 
                 if other_errors:
-                    logger.warning(f"Failed to update {len(other_errors)} documents in {index_name}")
+                    first_error = next(iter(other_errors[0].values()), {}).get('error')
+                    logger.warning("Failed to update %d documents in %s (first error: %s)",
+                                   len(other_errors), index_name, first_error)
+                return rejected
+            return []
         except Exception as e:
-            logger.error(f"Error executing bulk update: {e}")
+            logger.error("Error executing bulk update: %s", e)
             raise
-
+    
+    def _update_docs(self, updates: Iterable[Dict[str, Any]],
+                     id_field: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (document ID, fields to update) pairs, skipping updates without an ID or any fields."""
+        for update in updates:
+            doc_id = update.get(id_field)
+            if not _has_id(doc_id):
+                logger.warning("Update missing %s, skipping: %s", id_field, update)
+                continue
+            
+            # Remove id_field from update doc (it's used as _id, not as a field to update)
+            update_doc = {k: v for k, v in update.items() if k != id_field}
+            
+            if not update_doc:
+                logger.warning("Update for %s has no fields to update, skipping", doc_id)
+                continue
+            
+            yield str(doc_id), update_doc
+    
+    def _update_actions(self, index_name: str, updates: Iterable[Dict[str, Any]],
+                        id_field: str) -> Iterator[Dict[str, Any]]:
+        """Yield bulk update actions, skipping updates without an ID or any fields."""
+        for doc_id, update_doc in self._update_docs(updates, id_field):
+            yield {
+                "_op_type": "update",
+                "_index": index_name,
+                "_id": doc_id,
+                "doc": update_doc,
+                "doc_as_upsert": False,  # Don't create documents if they don't exist
+                "retry_on_conflict": UPDATE_RETRY_ON_CONFLICT
+            }
+    
+    def _update_lines(self, updates: Iterable[Dict[str, Any]], id_field: str) -> Iterator[bytes]:
+        """Yield NDJSON update entries, skipping the same updates as _update_actions."""
+        for doc_id, update_doc in self._update_docs(updates, id_field):
+            header = {"update": {"_id": doc_id, "retry_on_conflict": UPDATE_RETRY_ON_CONFLICT}}
+            yield b"".join((orjson.dumps(header), b"\n",
+                            self.serializer.dumps_bytes({"doc": update_doc, "doc_as_upsert": False}), b"\n"))
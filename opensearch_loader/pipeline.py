@@ -0,0 +1,291 @@
+"""Helpers for overlapping Memgraph reads with OpenSearch writes."""
+
+import json
+import logging
+import queue
+import threading
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Executor, Future, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+logger = logging.getLogger("OpenSearchLoader")
+
+T = TypeVar('T')
+
+# Number of pages fetched ahead of the page currently being written
+PREFETCH_PAGES = 2
+
+# Marks the end of the producer's output
+_END = object()
+
+# How often a blocked producer re-checks whether the consumer has gone away
+_PUT_TIMEOUT = 0.1
+
+# Adaptive bulk size: growth factor after a fast request, and bounds relative to the initial size
+ADAPTIVE_GROWTH = 1.25
+ADAPTIVE_MIN_DOCS = 100
+ADAPTIVE_MAX_FACTOR = 4
+
+
+def prefetch(iterable: Iterable[T], maxsize: int = PREFETCH_PAGES) -> Iterator[T]:
+    """Iterate in a background thread, buffering up to maxsize items ahead of the consumer.
+    
+    Lets the next Memgraph page be fetched while the current one is being written
+    to OpenSearch. Exceptions raised by the producer are re-raised in the consumer
+    after the items produced before the failure. Closing the returned generator
+    stops the producer and closes the source iterable.
+    
+    Args:
+        iterable: Source of items (e.g. a paginated query generator)
+        maxsize: Maximum number of items buffered ahead (default: PREFETCH_PAGES)
+        
+    Yields:
+        Items from iterable, in order
+    """
+    pages: queue.Queue = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+    state: Dict[str, Any] = {'exc': None}
+    
+    def put(item) -> bool:
+        # Block until there is room, giving up if the consumer has stopped
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce():
+        try:
+            for item in iterable:
+                if not put(item):
+                    break
+        except BaseException as e:
+            state['exc'] = e
+        finally:
+            close = getattr(iterable, 'close', None)
+            if close is not None:
+                close()
+            put(_END)
+    
+    producer = threading.Thread(target=produce, name='prefetch', daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = pages.get()
+            if item is _END:
+                break
+            yield item
+        if state['exc'] is not None:
+            raise state['exc']
+    finally:
+        stop.set()
+        producer.join()
+
+
+class BulkSubmitter:
+    """Submits bulk requests to a shared executor with a bounded number in flight.
+    
+    Each query gets its own submitter so its requests can be drained independently,
+    while the executor (and its connections) is shared across queries and indices.
+    """
+    
+    def __init__(self, executor: Executor, max_in_flight: int):
+        """Initialize the submitter.
+        
+        Args:
+            executor: Executor that runs the bulk requests
+            max_in_flight: Maximum number of outstanding requests for this submitter
+        """
+        self.executor = executor
+        self.max_in_flight = max(1, max_in_flight)
+        self.in_flight: Set[Future] = set()
+        self.completed = 0  # Sum of the counts returned by completed requests
+    
+    def submit(self, fn: Callable[..., int], *args, **kwargs):
+        """Submit a bulk request, first waiting for a slot if max_in_flight are outstanding.
+        
+        Args:
+            fn: Callable performing the request and returning the number of documents written
+            
+        Raises:
+            Exception: The first error raised by a completed request
+        """
+        if len(self.in_flight) >= self.max_in_flight:
+            self._collect(FIRST_COMPLETED)
+        self.in_flight.add(self.executor.submit(fn, *args, **kwargs))
+    
+    def drain(self) -> int:
+        """Wait for all outstanding requests.
+        
+        Returns:
+            Total count returned by all completed requests
+            
+        Raises:
+            Exception: The first error raised by a completed request
+        """
+        if self.in_flight:
+            self._collect(ALL_COMPLETED)
+        return self.completed
+    
+    def cancel(self):
+        """Cancel queued requests and wait for running ones, discarding their results."""
+        for future in self.in_flight:
+            future.cancel()
+        wait(self.in_flight)
+        self.in_flight.clear()
+    
+    def _collect(self, return_when: str):
+        done, self.in_flight = wait(self.in_flight, return_when=return_when)
+        for future in done:
+            self.completed += future.result()
+
+
+class RunningTotal:
+    """Thread-safe running sum, e.g. of documents written by a query's bulk requests."""
+    
+    def __init__(self):
+        self.total = 0
+        self._lock = threading.Lock()
+    
+    def add(self, count: int) -> int:
+        """Add count and return the new total."""
+        with self._lock:
+            self.total += count
+            return self.total
+
+
+class QueryTimer:
+    """Yields the pages from (page, seconds) tuples, summing the seconds into total.
+    
+    Empty pages are dropped after their time is counted. Read total once iteration
+    has finished (for a prefetched timer, after the prefetch generator is closed).
+    """
+    
+    def __init__(self, timed_pages: Iterator[Tuple[List[Dict[str, Any]], float]]):
+        self._source = timed_pages
+        self.total = 0.0
+    
+    def __iter__(self) -> 'QueryTimer':
+        return self
+    
+    def __next__(self) -> List[Dict[str, Any]]:
+        while True:
+            page, seconds = next(self._source)
+            self.total += seconds
+            if page:
+                return page
+    
+    def close(self):
+        """Close the underlying page generator."""
+        close = getattr(self._source, 'close', None)
+        if close is not None:
+            close()
+
+
+class AdaptiveBulkSize:
+    """Feedback controller for the number of documents per bulk request.
+    
+    The size grows by ADAPTIVE_GROWTH after each request that finishes within the
+    latency target and is halved after a slow or failed one (retries and their
+    backoff count towards the duration). It stays between ADAPTIVE_MIN_DOCS and
+    ADAPTIVE_MAX_FACTOR times the initial size. Results are reported from the bulk
+    executor's threads, so updates are locked.
+    """
+    
+    def __init__(self, initial: int, target_seconds: float):
+        """Initialize the controller.
+        
+        Args:
+            initial: Starting number of documents per batch
+            target_seconds: Request duration below which the size grows
+        """
+        self.minimum = min(initial, ADAPTIVE_MIN_DOCS)
+        self.maximum = initial * ADAPTIVE_MAX_FACTOR
+        self.target_seconds = target_seconds
+        self._size = float(initial)
+        self._lock = threading.Lock()
+    
+    @property
+    def size(self) -> int:
+        """Current number of documents per batch."""
+        return int(self._size)
+    
+    def record(self, seconds: Optional[float]):
+        """Adjust the size from one request's duration, or None if it failed."""
+        with self._lock:
+            if seconds is not None and seconds <= self.target_seconds:
+                self._size = min(self._size * ADAPTIVE_GROWTH, self.maximum)
+            else:
+                self._size = max(self._size / 2, self.minimum)
+
+
+def _estimate_page_bytes(page: List[Dict[str, Any]]) -> int:
+    """Estimate the serialized size of a page from its first document."""
+    return len(json.dumps(page[0], default=str)) * len(page)
+
+
+def coalesce_pages(pages: Iterable[List[Dict[str, Any]]], target_docs: int, target_bytes: int,
+                   sizer: Optional[AdaptiveBulkSize] = None) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """Regroup pages into batches of roughly target size.
+    
+    Consecutive small pages are merged, and a batch is emitted as soon as it reaches
+    target_docs documents or an estimated target_bytes of JSON. A page that exceeds
+    either target on its own is split into target-sized batches, so one oversized
+    page cannot produce an oversized bulk request (or a large retry). Empty pages
+    are skipped.
+    
+    Args:
+        pages: Iterable of pages (lists of documents)
+        target_docs: Document count at which a batch is emitted
+        target_bytes: Estimated serialized size at which a batch is emitted
+        sizer: Optional adaptive controller; when given, its current size replaces
+            target_docs for each page
+        
+    Yields:
+        (label, documents) tuples, where label names the page(s) in the batch
+        (e.g. "3", "3-5", or "3.2" for the second part of a split page 3)
+    """
+    batch: List[Dict[str, Any]] = []
+    batch_bytes = 0
+    page_owner = None  # The batch list once it is our own copy
+    first_page = 0
+    page_num = 0
+    for page in pages:
+        page_num += 1
+        if not page:
+            continue
+        if sizer is not None:
+            target_docs = sizer.size
+        page_bytes = _estimate_page_bytes(page)
+        if len(page) > target_docs or page_bytes > target_bytes:
+            # Flush what has been merged so far, then split the page
+            if batch:
+                yield _page_label(first_page, page_num - 1), batch
+                batch = []
+                batch_bytes = 0
+            per_batch = min(target_docs, max(1, target_bytes * len(page) // page_bytes))
+            for part, start in enumerate(range(0, len(page), per_batch), 1):
+                yield f"{page_num}.{part}", page[start:start + per_batch]
+            continue
+        if not batch:
+            # Pass a lone page through without copying
+            first_page = page_num
+            batch = page
+        elif batch is page_owner:
+            batch.extend(page)
+        else:
+            # Copy before growing so the caller's page is not modified
+            batch = batch + page
+            page_owner = batch
+        batch_bytes += page_bytes
+        if len(batch) >= target_docs or batch_bytes >= target_bytes:
+            yield _page_label(first_page, page_num), batch
+            batch = []
+            batch_bytes = 0
+    if batch:
+        yield _page_label(first_page, page_num), batch
+
+
+def _page_label(first_page: int, last_page: int) -> str:
+    return str(first_page) if first_page == last_page else f"{first_page}-{last_page}"
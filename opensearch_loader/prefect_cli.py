@@ -1,12 +1,12 @@
 import os
 import glob
-import yaml
 import logging
 import requests
 import subprocess
 import prefect.variables as Variables
-from typing import Literal, Optional, Dict, Any, List
+from typing import Literal, Dict, Any
 from .cli import setup_logging, print_config
+from .config import Config as BaseConfig, load_yaml_file
 from prefect import flow
 from .loader import Loader
 from bento.common.secret_manager import get_secret
@@ -24,7 +24,8 @@ ES_HOST = "es_host"
 MEMGRAPH_PORT = 7687
 log = get_logger('OpenSearchLoader')
 
-class Config:
+class Config(BaseConfig):
+    """Configuration built from Prefect flow parameters instead of YAML/env/CLI."""
     
     def __init__(self, memgraph_host, memgraph_port, memgraph_username, memgraph_password, opensearch_host, indices_file, about_file, model_files, selected_indices):
         self.config: Dict[str, Any] = {}
@@ -44,94 +45,8 @@ class Config:
         self.config["model_files"] = model_files
         self.config["selected_indices"] = selected_indices
 
-        self.config = self._trim_config_values(self.config)
-    
-    def _trim_config_values(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively trim whitespace from string values in configuration."""
-        if isinstance(config, dict):
-            return {k: self._trim_config_values(v) for k, v in config.items()}
-        elif isinstance(config, list):
-            return [self._trim_config_values(item) for item in config]
-        elif isinstance(config, str):
-            return config.strip()
-        else:
-            return config
-    
-    def _set_nested(self, d: Dict, key: str, value: Any):
-        """Set nested dictionary value."""
-        # Trim string values
-        if isinstance(value, str):
-            value = value.strip()
-        d[key] = value
-    
-    
-    def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value."""
-        return self.config.get(key, default)
-    
-    def get_memgraph_config(self) -> Dict[str, Any]:
-        """Get Memgraph configuration."""
-        return self.config.get('memgraph', {})
-    
-    def get_opensearch_config(self) -> Dict[str, Any]:
-        """Get OpenSearch configuration."""
-        return self.config.get('opensearch', {})
-    
-    def get_index_spec_file(self) -> Optional[str]:
-        """Get index specification file path."""
-        return self.config.get('index_spec_file')
-    
-    def get_clear_existing_indices(self) -> bool:
-        """Get clear_existing_indices setting."""
-        return self.config.get('clear_existing_indices', False)
-    
-    def get_allow_index_creation(self) -> bool:
-        """Get allow_index_creation setting."""
-        return self.config.get('allow_index_creation', True)
-    
-    def get_selected_indices(self) -> Optional[List[str]]:
-        """Get selected_indices setting.
-        
-        Returns a list of index names with whitespace trimmed, or None if not set or empty.
-        If None is returned, all indices should be processed.
-        """
-        selected = self.config.get('selected_indices')
-        if selected is None:
-            return None
-        
-        # Ensure it's a list and trim each value
-        if isinstance(selected, list):
-            # If empty list is provided, return None to process all indices
-            if not selected:
-                return None
-            # Trim each index name and filter out empty strings
-            trimmed = [v.strip() if isinstance(v, str) else str(v).strip() for v in selected if v]
-            # If all values were empty strings, return None to process all indices
-            return trimmed if trimmed else None
-        elif isinstance(selected, str):
-            # Handle string case (shouldn't happen with proper config, but defensive)
-            trimmed = selected.strip()
-            return [trimmed] if trimmed else None
-        
-        return None
-    
-    def get_about_file(self) -> Optional[str]:
-        """Get about_file path."""
-        return self.config.get('about_file')
-    
-    def get_model_files(self) -> Optional[List[str]]:
-        """Get model_files list."""
-        model_files = self.config.get('model_files')
-        if model_files is None:
-            return None
-        if isinstance(model_files, list):
-            return [v.strip() if isinstance(v, str) else str(v).strip() for v in model_files if v]
-        elif isinstance(model_files, str):
-            return [model_files.strip()] if model_files.strip() else None
-        return None
-    
-    def get_test_mode(self) -> bool:
-        return self.config.get('test_mode', False)
+        self._trim_config_values(self.config)
+        self._resolved = self._resolve()
 
 def get_github_branches(repo_url):
     # Remove .git if present
@@ -168,8 +83,7 @@ def repo_download(repo, version, logger):
     return repo_folder
 
 config_file = DROP_DOWN_CONFIG
-with open(config_file, 'r') as file:
-    config_drop_list = yaml.safe_load(file)
+config_drop_list = load_yaml_file(config_file)
 model_repo_url = config_drop_list.get(MODEL_REPO_URL)
 monorepo_url = config_drop_list.get(MONOREPO_URL)
 model_branch_choices = Literal[tuple(get_github_branches(model_repo_url))]
@@ -213,12 +127,9 @@ def opensearch_loader_prefect(
         selected_indices=selected_indices
     )
     print_config(config)
-    loader = Loader(config)
-    try:
+    with Loader(config) as loader:
         loader.load()
         logger.info("Data loading completed")
-    finally:
-        loader.close()
     
     return 0
 
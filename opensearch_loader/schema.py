@@ -1,9 +1,9 @@
 """Schema parser for model YAML files."""
 
 import os
-import yaml
 import logging
 from typing import Dict, Any, List, Set, Optional
+from .config import load_yaml_file
 from .props import Props
 
 logger = logging.getLogger("OpenSearchLoader")
@@ -52,10 +52,9 @@ class Schema:
             try:
                 logger.info(f'Reading schema file: {a_file} ...')
                 if os.path.isfile(a_file):
-                    with open(a_file) as schema_file:
-                        schema = yaml.safe_load(schema_file)
-                        if schema:
-                            self.org_schema.update(schema)
+                    schema = load_yaml_file(a_file)
+                    if schema:
+                        self.org_schema.update(schema)
             except Exception as e:
                 logger.exception(e)
         
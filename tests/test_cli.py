@@ -0,0 +1,34 @@
+"""Tests for CLI logging setup."""
+
+import logging
+import unittest
+
+from opensearch_loader.cli import setup_logging
+
+
+class SetupLoggingTest(unittest.TestCase):
+    
+    def setUp(self):
+        root = logging.getLogger()
+        saved = root.handlers[:], root.level
+        self.host_handler = logging.NullHandler()
+        root.handlers = [self.host_handler]
+        
+        def restore():
+            root.handlers, level = saved
+            root.setLevel(level)
+        self.addCleanup(restore)
+    
+    def test_embedded_keeps_host_handlers(self):
+        setup_logging()
+        self.assertEqual(logging.getLogger().handlers, [self.host_handler])
+    
+    def test_standalone_replaces_handlers(self):
+        setup_logging(verbose=True, force=True)
+        root = logging.getLogger()
+        self.assertNotIn(self.host_handler, root.handlers)
+        self.assertEqual(root.level, logging.DEBUG)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+"""Tests for YAML loading helpers."""
+
+import os
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from opensearch_loader import config as config_module
+from opensearch_loader.config import Config, iter_yaml_sequence
+
+
+class IterYamlSequenceTest(unittest.TestCase):
+    
+    def write(self, text):
+        fd, path = tempfile.mkstemp(suffix='.yaml')
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+        self.addCleanup(os.unlink, path)
+        return path
+    
+    def test_items(self):
+        path = self.write("- page: 1\n- page: 2\n")
+        self.assertEqual(list(iter_yaml_sequence(path)), [{'page': 1}, {'page': 2}])
+    
+    def test_empty_document(self):
+        for text in ("", "---\n", "# comment only\n"):
+            with self.subTest(text=text):
+                self.assertEqual(list(iter_yaml_sequence(self.write(text))), [])
+    
+    def test_non_list_root(self):
+        for text in ("''\n", '""\n', "page: 1\n", "text\n"):
+            with self.subTest(text=text):
+                with self.assertRaisesRegex(ValueError, "must be a list"):
+                    list(iter_yaml_sequence(self.write(text)))
+
+
+
+class ConfigTestCase(unittest.TestCase):
+    """Loads a Config from YAML text, with the parsed-config cache in a temporary directory."""
+    
+    def load(self, text):
+        workdir = tempfile.TemporaryDirectory()
+        self.addCleanup(workdir.cleanup)
+        path = os.path.join(workdir.name, 'config.yaml')
+        with open(path, 'w') as f:
+            f.write(text)
+        with mock.patch('opensearch_loader.config.CONFIG_CACHE_DIR', Path(workdir.name) / 'cache'):
+            return Config(path)
+
+
+class NameListTest(ConfigTestCase):
+    
+    def test_selected_indices_trimmed_and_deduplicated(self):
+        config = self.load("selected_indices: [' users ', products, users, '']\n")
+        self.assertEqual(config.get_selected_indices(), ('users', 'products'))
+    
+    def test_empty_selection_selects_all(self):
+        config = self.load("selected_indices: []\n")
+        self.assertIsNone(config.get_selected_indices())
+        self.assertTrue(config.is_selected('users'))
+    
+    def test_model_files_kept_as_given(self):
+        config = self.load("model_files: [' a.yml ', b.yml, a.yml]\n")
+        self.assertEqual(config.get_model_files(), ('a.yml', 'b.yml', 'a.yml'))
+    
+    def test_empty_model_files_distinct_from_unset(self):
+        self.assertEqual(self.load("model_files: []\n").get_model_files(), ())
+        self.assertIsNone(self.load("about_file: about.yaml\n").get_model_files())
+
+
+
+class CountSettingTest(ConfigTestCase):
+    
+    def test_default(self):
+        self.assertEqual(self.load("about_file: about.yaml\n").get_max_index_workers(), 2)
+    
+    def test_zero_is_clamped_to_one(self):
+        config = self.load("max_index_workers: 0\nbulk_workers: 0\n")
+        self.assertEqual(config.get_max_index_workers(), 1)
+        self.assertEqual(config.get_bulk_workers(), 1)
+    
+    def test_explicit_value(self):
+        self.assertEqual(self.load("max_index_workers: 3\n").get_max_index_workers(), 3)
+
+
+
+class ConfigCacheTest(unittest.TestCase):
+    
+    def setUp(self):
+        workdir = tempfile.TemporaryDirectory()
+        self.addCleanup(workdir.cleanup)
+        patcher = mock.patch.object(config_module, 'CONFIG_CACHE_DIR', Path(workdir.name) / 'cache')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.path = os.path.join(workdir.name, 'config.yaml')
+        self.write("bulk_workers: 8\n")
+    
+    def write(self, text):
+        with open(self.path, 'w') as f:
+            f.write(text)
+    
+    def cached(self):
+        return config_module._read_config_cache(self.path, os.stat(self.path))
+    
+    def test_round_trip(self):
+        self.assertEqual(Config(self.path).get_bulk_workers(), 8)
+        self.assertEqual(self.cached(), {'bulk_workers': 8})
+        
+        with mock.patch.object(config_module, 'load_yaml_file') as load_yaml_file:
+            self.assertEqual(Config(self.path).get_bulk_workers(), 8)
+        load_yaml_file.assert_not_called()
+    
+    def test_changed_file_invalidates(self):
+        Config(self.path)
+        self.write("bulk_workers: 16\n")
+        
+        self.assertIsNone(self.cached())
+        self.assertEqual(Config(self.path).get_bulk_workers(), 16)
+    
+    def test_other_version_invalidates(self):
+        Config(self.path)
+        
+        with mock.patch.object(config_module, 'CONFIG_CACHE_VERSION', config_module.CONFIG_CACHE_VERSION + 1):
+            self.assertIsNone(self.cached())
+    
+    def test_unreadable_entry_is_a_miss(self):
+        Config(self.path)
+        cache_path = config_module._config_cache_path(self.path)
+        st = os.stat(self.path)
+        entries = (
+            b"not a pickle",
+            pickle.dumps((st.st_mtime_ns, st.st_size, {'bulk_workers': 8})),  # Unversioned format
+        )
+        for entry in entries:
+            with self.subTest(entry=entry[:16]):
+                cache_path.write_bytes(entry)
+                self.assertIsNone(self.cached())
+                self.assertEqual(Config(self.path).get_bulk_workers(), 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,246 @@
+"""Tests for the Loader's index processing, using in-memory Memgraph and OpenSearch clients."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from opensearchpy.exceptions import ConnectionError as OpenSearchConnectionError, TransportError
+from opensearchpy.helpers import BulkIndexError
+
+from opensearch_loader.config import Config
+from opensearch_loader.loader import Loader, _is_retryable
+
+
+class FakeMemgraph:
+    """Returns fixed rows per query as a single page."""
+    
+    def __init__(self, rows):
+        self.rows = rows
+    
+    def execute_paginated_query(self, query, **kwargs):
+        yield list(self.rows.get(query, [])), 0.0
+        yield [], 0.0
+    
+    def close(self):
+        pass
+
+
+class FakeOpenSearch:
+    """Tracks indices (documents by ID), their dynamic mapping setting and aliases by name."""
+    
+    def __init__(self):
+        self.indices = {}
+        self.dynamic = {}
+        self.aliases = {}
+    
+    def index_exists(self, index_name):
+        return index_name in self.indices
+    
+    def create_index(self, index_name, mapping=None, force=False, dynamic=False):
+        if force:
+            self.delete_index(index_name)
+        if index_name in self.indices:
+            return False
+        self.indices[index_name] = {}
+        self.dynamic[index_name] = dynamic
+        return True
+    
+    def delete_index(self, index_name):
+        self.indices.pop(index_name, None)
+    
+    def bulk_upsert(self, index_name, documents, id_field, query_name=None, id_prefix=""):
+        docs = self.indices[index_name]
+        for doc in documents:
+            docs[f"{id_prefix}{doc[id_field]}"] = doc
+        return len(documents)
+    
+    def swap_alias(self, alias, index_name):
+        previous = self.aliases.get(alias)
+        self.aliases[alias] = index_name
+        if previous is not None and previous != index_name:
+            self.delete_index(previous)
+    
+    def get_index_settings(self, index_name, *names):
+        return {name: None for name in names}
+    
+    def set_index_settings(self, index_name, settings):
+        pass
+    
+    def refresh_index(self, index_name):
+        pass
+    
+    def close(self):
+        pass
+
+
+class LoaderTestCase(unittest.TestCase):
+    """Builds a Loader from YAML configuration text in a temporary directory."""
+    
+    def make_loader(self, config_text, memgraph, opensearch):
+        workdir = tempfile.TemporaryDirectory()
+        self.addCleanup(workdir.cleanup)
+        cwd = os.getcwd()
+        os.chdir(workdir.name)
+        self.addCleanup(os.chdir, cwd)
+        with open('config.yaml', 'w') as f:
+            f.write(config_text)
+        
+        with mock.patch('opensearch_loader.config.CONFIG_CACHE_DIR', Path(workdir.name) / 'cache'), \
+                mock.patch('opensearch_loader.loader.MemgraphClient', return_value=memgraph), \
+                mock.patch('opensearch_loader.loader.OpenSearchClient', return_value=opensearch):
+            loader = Loader(Config('config.yaml'))
+        self.addCleanup(loader.close)
+        return loader
+
+
+class AliasSwapTest(LoaderTestCase):
+    
+    QUERY = "MATCH (p:P) RETURN p.id AS pid SKIP $skip LIMIT $limit"
+    INDEX_CONFIG = {
+        'index_name': 'programs',
+        'id_field': 'pid',
+        'mapping': {'keyword': ['pid']},
+        'initial_query': {'query': QUERY},
+    }
+    
+    def test_validation_failure_keeps_previous_index(self):
+        memgraph = FakeMemgraph({self.QUERY: [{'pid': 'p1', 'unmapped': 1}]})
+        opensearch = FakeOpenSearch()
+        opensearch.create_index('programs-old')
+        opensearch.aliases['programs'] = 'programs-old'
+        loader = self.make_loader("alias_swap: true\n", memgraph, opensearch)
+        
+        stats = loader._run_index(self.INDEX_CONFIG)
+        
+        self.assertTrue(stats['error'])
+        self.assertEqual(opensearch.aliases, {'programs': 'programs-old'})
+        self.assertEqual(list(opensearch.indices), ['programs-old'])
+    
+    def test_existing_index_name_is_not_recreated(self):
+        memgraph = FakeMemgraph({self.QUERY: [{'pid': 'p1'}]})
+        opensearch = FakeOpenSearch()
+        opensearch.create_index('programs-20260101000000')
+        opensearch.indices['programs-20260101000000']['p0'] = {'pid': 'p0'}
+        opensearch.aliases['programs'] = 'programs-20260101000000'
+        loader = self.make_loader("alias_swap: true\n", memgraph, opensearch)
+        loader._index_suffix = '20260101000000'
+        
+        stats = loader._run_index(self.INDEX_CONFIG)
+        
+        self.assertTrue(stats['error'])
+        self.assertEqual(opensearch.aliases, {'programs': 'programs-20260101000000'})
+        self.assertEqual(opensearch.indices, {'programs-20260101000000': {'p0': {'pid': 'p0'}}})
+
+
+
+class StrictMappingTest(LoaderTestCase):
+    
+    QUERY = "MATCH (p:P) RETURN p.id AS pid, p.extra AS extra SKIP $skip LIMIT $limit"
+    INDEX_CONFIG = {
+        'index_name': 'programs',
+        'id_field': 'pid',
+        'mapping': {'keyword': ['pid']},
+        'initial_query': {'query': QUERY},
+    }
+    
+    def setUp(self):
+        self.memgraph = FakeMemgraph({self.QUERY: [{'pid': 'p1', 'extra': 1}]})
+        self.opensearch = FakeOpenSearch()
+    
+    def test_created_strict_index_skips_validation(self):
+        loader = self.make_loader("strict_mapping: true\n", self.memgraph, self.opensearch)
+        
+        stats = loader._run_index(self.INDEX_CONFIG)
+        
+        # Unmapped fields are left for the strict index to reject
+        self.assertEqual(self.opensearch.dynamic['programs'], 'strict')
+        self.assertEqual(stats['document_count'], 1)
+        self.assertEqual(list(self.opensearch.indices['programs']), ['p1'])
+    
+    def test_existing_index_is_validated(self):
+        self.opensearch.create_index('programs')
+        loader = self.make_loader("strict_mapping: true\nallow_index_creation: false\n",
+                                  self.memgraph, self.opensearch)
+        
+        stats = loader._run_index(self.INDEX_CONFIG)
+        
+        self.assertEqual(self.opensearch.dynamic['programs'], False)
+        self.assertEqual(stats['document_count'], 0)
+        self.assertEqual(self.opensearch.indices['programs'], {})
+
+
+
+def bulk_error(*statuses):
+    """BulkIndexError with one failed index item per status."""
+    return BulkIndexError("failed", [{'index': {'_id': str(n), 'status': status}}
+                                     for n, status in enumerate(statuses)])
+
+
+class RetryBulkTest(LoaderTestCase):
+    
+    RETRYABLE = [
+        TransportError(429, 'too_many_requests', {}),
+        TransportError(502, 'bad_gateway', {}),
+        TransportError(503, 'unavailable', {}),
+        TransportError(504, 'gateway_timeout', {}),
+        OpenSearchConnectionError('N/A', 'connection refused', OSError()),
+        bulk_error(429),
+        bulk_error(429, 429),
+    ]
+    NOT_RETRYABLE = [
+        TransportError(400, 'mapper_parsing_exception', {}),
+        TransportError(404, 'index_not_found_exception', {}),
+        TransportError(500, 'internal_server_error', {}),
+        bulk_error(400),
+        bulk_error(429, 400),
+        bulk_error(),
+    ]
+    
+    def setUp(self):
+        self.loader = self.make_loader("bulk_retry_attempts: 3\n", FakeMemgraph({}), FakeOpenSearch())
+        sleep = mock.patch('opensearch_loader.loader.time.sleep')
+        self.sleep = sleep.start()
+        self.addCleanup(sleep.stop)
+    
+    def test_classification(self):
+        for error in self.RETRYABLE:
+            with self.subTest(error=error):
+                self.assertTrue(_is_retryable(error))
+        for error in self.NOT_RETRYABLE:
+            with self.subTest(error=error):
+                self.assertFalse(_is_retryable(error))
+    
+    def test_retryable_error_retried_until_success(self):
+        for error in self.RETRYABLE:
+            with self.subTest(error=error):
+                self.sleep.reset_mock()
+                op = mock.Mock(side_effect=[error, error, 'done'])
+                
+                self.assertEqual(self.loader._retry_bulk(op, 'index', key='value'), 'done')
+                self.assertEqual(op.call_count, 3)
+                op.assert_called_with('index', key='value')
+                self.assertEqual(self.sleep.call_count, 2)
+    
+    def test_retryable_error_raised_after_last_attempt(self):
+        op = mock.Mock(side_effect=TransportError(503, 'unavailable', {}))
+        
+        with self.assertRaises(TransportError):
+            self.loader._retry_bulk(op)
+        self.assertEqual(op.call_count, 3)
+    
+    def test_non_retryable_error_raised_on_first_attempt(self):
+        for error in self.NOT_RETRYABLE:
+            with self.subTest(error=error):
+                self.sleep.reset_mock()
+                op = mock.Mock(side_effect=error)
+                
+                with self.assertRaises(type(error)):
+                    self.loader._retry_bulk(op)
+                self.assertEqual(op.call_count, 1)
+                self.sleep.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""Tests for MemgraphClient pagination, with the neo4j driver replaced."""
+
+import unittest
+from unittest import mock
+
+from opensearch_loader.memgraph_client import STREAM_LIMIT, MemgraphClient
+
+KEYSET_QUERY = "MATCH (n:N) WHERE $cursor IS NULL OR n.id > $cursor RETURN n.id AS id ORDER BY n.id LIMIT $limit"
+
+
+class FakeDriver:
+    """Returns scripted results, one list per query run, recording each run's parameters."""
+    
+    def __init__(self, results):
+        self.results = list(results)
+        self.runs = []
+        self.session_options = []
+    
+    def session(self, **options):
+        self.session_options.append(options)
+        return FakeSession(self)
+    
+    def close(self):
+        pass
+
+
+class FakeSession:
+    
+    def __init__(self, driver):
+        self.driver = driver
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def run(self, query, parameters):
+        self.driver.runs.append(dict(parameters))
+        return iter(self.driver.results.pop(0))
+
+
+def rows(*ids):
+    return [{'id': i} for i in ids]
+
+
+class PaginatedQueryTest(unittest.TestCase):
+    
+    def make_client(self, results, stream_queries=False):
+        driver = FakeDriver(results)
+        with mock.patch('opensearch_loader.memgraph_client.GraphDatabase') as graph_database:
+            graph_database.driver.return_value = driver
+            client = MemgraphClient(stream_queries=stream_queries)
+        return client, driver
+    
+    def pages(self, client, **kwargs):
+        return [page for page, _ in client.execute_paginated_query(KEYSET_QUERY, page_size=2,
+                                                                   cursor_field='id', **kwargs)]
+    
+    def test_keyset_cursor_advances_from_last_row(self):
+        client, driver = self.make_client([rows(1, 2), rows(3, 4), rows(5)])
+        
+        self.assertEqual(self.pages(client, parameters={'label': 'x'}), [rows(1, 2), rows(3, 4), rows(5)])
+        self.assertEqual(driver.runs, [
+            {'label': 'x', 'cursor': None, 'skip': 0, 'limit': 2},
+            {'label': 'x', 'cursor': 2, 'skip': 0, 'limit': 2},
+            {'label': 'x', 'cursor': 4, 'skip': 0, 'limit': 2},
+        ])
+    
+    def test_keyset_ends_with_empty_page(self):
+        client, driver = self.make_client([rows(1, 2), []])
+        
+        self.assertEqual(self.pages(client), [rows(1, 2), []])
+        self.assertEqual([run['cursor'] for run in driver.runs], [None, 2])
+    
+    def test_null_cursor_raises(self):
+        client, _ = self.make_client([[{'id': 1}, {'id': None}], rows(3)])
+        
+        with self.assertRaisesRegex(ValueError, "Cursor field 'id'"):
+            self.pages(client)
+    
+    def test_missing_cursor_raises(self):
+        client, _ = self.make_client([[{'id': 1}, {'other': 2}], rows(3)])
+        
+        with self.assertRaisesRegex(ValueError, "Cursor field 'id'"):
+            self.pages(client)
+    
+    def test_stream_runs_keyset_query_once(self):
+        client, driver = self.make_client([rows(1, 2, 3, 4, 5)], stream_queries=True)
+        
+        self.assertEqual(self.pages(client), [rows(1, 2), rows(3, 4), rows(5)])
+        # The cursor stays null: the single run already returns every row
+        self.assertEqual(driver.runs, [{'cursor': None, 'skip': 0, 'limit': STREAM_LIMIT}])
+        self.assertEqual(driver.session_options, [{'fetch_size': 2}])
+    
+    def test_offset_pagination(self):
+        client, driver = self.make_client([rows(1, 2), rows(3)])
+        query = "MATCH (n:N) RETURN n.id AS id SKIP $skip LIMIT $limit"
+        
+        pages = [page for page, _ in client.execute_paginated_query(query, page_size=2)]
+        
+        self.assertEqual(pages, [rows(1, 2), rows(3)])
+        self.assertEqual(driver.runs, [{'skip': 0, 'limit': 2}, {'skip': 2, 'limit': 2}])
+
+
+if __name__ == '__main__':
+    unittest.main()
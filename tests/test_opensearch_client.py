@@ -0,0 +1,77 @@
+"""Tests for OpenSearchClient bulk request building, with the HTTP client replaced."""
+
+import json
+import unittest
+
+from opensearch_loader.opensearch_client import OpenSearchClient
+
+
+class RecordingClient:
+    """Records bulk request bodies and reports every item as successful."""
+    
+    def __init__(self):
+        self.bodies = []
+    
+    def bulk(self, body, index=None, **kwargs):
+        self.bodies.append(body)
+        return {'errors': False}
+
+
+def bulk_ids(body):
+    """Return the _id of each action line in an NDJSON bulk body."""
+    lines = [json.loads(line) for line in bytes(body).splitlines() if line]
+    return [action[next(iter(action))]['_id'] for action in lines[::2]]
+
+
+class BulkUpsertTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.opensearch = OpenSearchClient('http://localhost:9200')
+        self.recorder = self.opensearch.client = RecordingClient()
+    
+    def test_zero_id_is_indexed(self):
+        pages = [{'page': 0, 'title': 'Home'}, {'page': 1, 'title': 'About'}, {'title': 'No page'}]
+        
+        count = self.opensearch.bulk_upsert('about', pages, 'page', id_prefix='page')
+        
+        self.assertEqual(count, 2)
+        self.assertEqual([i for body in self.recorder.bodies for i in bulk_ids(body)], ['page0', 'page1'])
+    
+    def test_zero_id_action(self):
+        actions = self.opensearch._index_actions('about', [{'page': 0}, {'title': 'No page'}], 'page', 'page')
+        
+        self.assertEqual([action['_id'] for action in actions], ['page0'])
+    
+    def test_empty_id_is_skipped(self):
+        docs = [{'id': '', 'name': 'blank'}, {'id': None, 'name': 'null'}, {'id': 'a', 'name': 'ok'}]
+        
+        count = self.opensearch.bulk_upsert('users', docs, 'id')
+        actions = self.opensearch._index_actions('users', docs, 'id')
+        
+        self.assertEqual(count, 1)
+        self.assertEqual([i for body in self.recorder.bodies for i in bulk_ids(body)], ['a'])
+        self.assertEqual([action['_id'] for action in actions], ['a'])
+
+
+class BulkUpdateTest(unittest.TestCase):
+    
+    UPDATES = [{'id': 0, 'status': 'a'}, {'id': '', 'status': 'b'}, {'status': 'c'}, {'id': 'x', 'status': 'd'}]
+    
+    def setUp(self):
+        self.opensearch = OpenSearchClient('http://localhost:9200')
+        self.recorder = self.opensearch.client = RecordingClient()
+    
+    def test_ids_match_index_path(self):
+        self.opensearch.bulk_update('users', self.UPDATES, 'id')
+        
+        self.assertEqual([i for body in self.recorder.bodies for i in bulk_ids(body)], ['0', 'x'])
+    
+    def test_update_actions(self):
+        actions = self.opensearch._update_actions('users', self.UPDATES, 'id')
+        
+        self.assertEqual([(action['_id'], action['doc']) for action in actions],
+                         [('0', {'status': 'a'}), ('x', {'status': 'd'})])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,244 @@
+"""Tests for the read/write pipeline helpers."""
+
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from opensearch_loader.pipeline import (
+    ADAPTIVE_GROWTH, ADAPTIVE_MAX_FACTOR, ADAPTIVE_MIN_DOCS, AdaptiveBulkSize, BulkSubmitter,
+    coalesce_pages, prefetch,
+)
+
+# Large enough that no test batch reaches it
+NO_BYTE_LIMIT = 1 << 30
+
+
+def docs(*ids):
+    return [{'id': i} for i in ids]
+
+
+class CoalescePagesTest(unittest.TestCase):
+    
+    def test_lone_page_passes_through_uncopied(self):
+        page = docs(1, 2, 3)
+        
+        batches = list(coalesce_pages([page], 10, NO_BYTE_LIMIT))
+        
+        self.assertEqual(len(batches), 1)
+        label, batch = batches[0]
+        self.assertEqual(label, '1')
+        self.assertIs(batch, page)
+    
+    def test_merge_leaves_caller_pages_unchanged(self):
+        pages = [docs(1, 2), docs(3), docs(4)]
+        originals = [list(page) for page in pages]
+        
+        batches = list(coalesce_pages(pages, 10, NO_BYTE_LIMIT))
+        
+        self.assertEqual(batches, [('1-3', docs(1, 2, 3, 4))])
+        self.assertEqual(pages, originals)
+        self.assertIsNot(batches[0][1], pages[0])
+    
+    def test_batch_emitted_at_doc_target(self):
+        pages = [docs(1, 2), docs(3, 4), docs(5)]
+        
+        batches = list(coalesce_pages(pages, 4, NO_BYTE_LIMIT))
+        
+        self.assertEqual(batches, [('1-2', docs(1, 2, 3, 4)), ('3', docs(5))])
+    
+    def test_oversized_page_split_by_docs(self):
+        batches = list(coalesce_pages([docs(1, 2, 3, 4, 5)], 2, NO_BYTE_LIMIT))
+        
+        self.assertEqual(batches, [('1.1', docs(1, 2)), ('1.2', docs(3, 4)), ('1.3', docs(5))])
+    
+    def test_oversized_page_split_by_bytes(self):
+        page = docs(1, 2, 3, 4)
+        doc_bytes = len(json.dumps(page[0]))
+        
+        batches = list(coalesce_pages([page], 10, 2 * doc_bytes))
+        
+        self.assertEqual(batches, [('1.1', docs(1, 2)), ('1.2', docs(3, 4))])
+    
+    def test_split_flushes_merged_pages_first(self):
+        pages = [docs(1), docs(2), docs(3, 4, 5)]
+        
+        batches = list(coalesce_pages(pages, 2, NO_BYTE_LIMIT))
+        
+        self.assertEqual(batches, [('1-2', docs(1, 2)), ('3.1', docs(3, 4)), ('3.2', docs(5))])
+    
+    def test_empty_pages_skipped(self):
+        pages = [[], docs(1), [], docs(2), [], docs(3, 4, 5), []]
+        
+        batches = list(coalesce_pages(pages, 2, NO_BYTE_LIMIT))
+        
+        self.assertEqual(batches, [('2-4', docs(1, 2)), ('6.1', docs(3, 4)), ('6.2', docs(5))])
+    
+    def test_no_pages(self):
+        self.assertEqual(list(coalesce_pages([[], []], 2, NO_BYTE_LIMIT)), [])
+
+
+
+class PrefetchTest(unittest.TestCase):
+    
+    def run_with_timeout(self, fn, seconds=5):
+        """Run fn in a thread, failing the test if it does not finish in time."""
+        worker = threading.Thread(target=fn, daemon=True)
+        worker.start()
+        worker.join(seconds)
+        self.assertFalse(worker.is_alive(), "prefetch did not finish")
+    
+    def test_items_in_order(self):
+        self.assertEqual(list(prefetch(iter(range(10)), maxsize=2)), list(range(10)))
+    
+    def test_error_raised_after_produced_items(self):
+        def failing():
+            yield 1
+            yield 2
+            raise RuntimeError("query failed")
+        
+        received = []
+        with self.assertRaisesRegex(RuntimeError, "query failed"):
+            for item in prefetch(failing()):
+                received.append(item)
+        self.assertEqual(received, [1, 2])
+    
+    def test_early_exit_closes_source(self):
+        closed = threading.Event()
+        
+        def endless():
+            try:
+                n = 0
+                while True:
+                    yield n
+                    n += 1
+            finally:
+                closed.set()
+        
+        def consume():
+            pages = prefetch(endless(), maxsize=1)
+            self.assertEqual(next(pages), 0)
+            # Let the producer fill the queue and block on the next put
+            time.sleep(0.05)
+            pages.close()
+        
+        self.run_with_timeout(consume)
+        self.assertTrue(closed.is_set())
+
+
+
+class BulkSubmitterTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=8)
+        self.addCleanup(self.executor.shutdown)
+    
+    def test_in_flight_bounded(self):
+        lock = threading.Lock()
+        state = {'running': 0, 'peak': 0}
+        
+        def request(count):
+            with lock:
+                state['running'] += 1
+                state['peak'] = max(state['peak'], state['running'])
+            time.sleep(0.01)
+            with lock:
+                state['running'] -= 1
+            return count
+        
+        bulk = BulkSubmitter(self.executor, 2)
+        for _ in range(10):
+            bulk.submit(request, 3)
+            self.assertLessEqual(len(bulk.in_flight), 2)
+        
+        self.assertEqual(bulk.drain(), 30)
+        self.assertLessEqual(state['peak'], 2)
+    
+    def test_failure_raised_from_submit(self):
+        def failing():
+            raise ValueError("bulk failed")
+        
+        bulk = BulkSubmitter(self.executor, 1)
+        bulk.submit(failing)
+        with self.assertRaisesRegex(ValueError, "bulk failed"):
+            bulk.submit(lambda: 1)
+    
+    def test_failure_raised_from_drain(self):
+        def failing():
+            raise ValueError("bulk failed")
+        
+        bulk = BulkSubmitter(self.executor, 4)
+        bulk.submit(lambda: 1)
+        bulk.submit(failing)
+        with self.assertRaisesRegex(ValueError, "bulk failed"):
+            bulk.drain()
+    
+    def test_cancel_leaves_nothing_pending(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        started = threading.Event()
+        release = threading.Event()
+        ran = []
+        
+        def request(n):
+            started.set()
+            release.wait(5)
+            ran.append(n)
+            return 1
+        
+        bulk = BulkSubmitter(executor, 3)
+        for n in range(3):
+            bulk.submit(request, n)
+        # The first request is running; the others are still queued and get cancelled
+        self.assertTrue(started.wait(5))
+        threading.Timer(0.05, release.set).start()
+        bulk.cancel()
+        
+        self.assertEqual(bulk.in_flight, set())
+        self.assertEqual(ran, [0])
+        self.assertEqual(bulk.drain(), 0)
+
+
+
+class AdaptiveBulkSizeTest(unittest.TestCase):
+    
+    def test_grows_after_fast_requests_up_to_max(self):
+        sizer = AdaptiveBulkSize(1000, 2.0)
+        
+        sizer.record(0.5)
+        self.assertEqual(sizer.size, int(1000 * ADAPTIVE_GROWTH))
+        sizer.record(2.0)  # At the target still counts as fast
+        self.assertEqual(sizer.size, int(1000 * ADAPTIVE_GROWTH ** 2))
+        for _ in range(50):
+            sizer.record(0.1)
+        self.assertEqual(sizer.size, 1000 * ADAPTIVE_MAX_FACTOR)
+    
+    def test_halves_after_slow_requests_down_to_min(self):
+        sizer = AdaptiveBulkSize(1000, 2.0)
+        
+        sizer.record(3.0)
+        self.assertEqual(sizer.size, 500)
+        for _ in range(50):
+            sizer.record(10.0)
+        self.assertEqual(sizer.size, ADAPTIVE_MIN_DOCS)
+    
+    def test_failure_halves(self):
+        sizer = AdaptiveBulkSize(1000, 2.0)
+        
+        sizer.record(None)
+        self.assertEqual(sizer.size, 500)
+    
+    def test_small_initial_size_is_the_floor(self):
+        sizer = AdaptiveBulkSize(ADAPTIVE_MIN_DOCS // 2, 2.0)
+        
+        for _ in range(10):
+            sizer.record(None)
+        self.assertEqual(sizer.size, ADAPTIVE_MIN_DOCS // 2)
+        for _ in range(50):
+            sizer.record(0.1)
+        self.assertEqual(sizer.size, ADAPTIVE_MIN_DOCS // 2 * ADAPTIVE_MAX_FACTOR)
+
+
+if __name__ == '__main__':
+    unittest.main()